@@ -5,20 +5,25 @@ Allows targeting specific journals/conferences like EuroVis, Eurographics, etc.
 """
 
 import os
+from pathlib import Path
 import sys
-import json
+import orjson
 import requests
 import pandas as pd
-import time
 import logging
+import functools
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, List, Optional, Any
 from requests.exceptions import RequestException, Timeout, HTTPError
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from requests_cache import CachedSession
 from utils.api_utils import (
-    APIError, ResponseError, RateLimitError,
-    validate_api_response, validate_paper_entry,
-    save_bibtex, save_results_to_csv, make_api_request
+    APIError, ResponseError, RateLimitError, RateLimiter,
+    save_bibtex, save_results_to_csv, save_results_to_parquet,
+    frame_column, clean_text_column, clean_year_column, drop_seen_papers
 )
 from dotenv import load_dotenv
 import ssl
@@ -26,32 +31,86 @@ import ssl
 # Load environment variables
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# Relative output directories are resolved against this script's folder,
+# so results land in the same place whatever the working directory is
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# Hits requested per page; kept small to avoid SSL issues
+DBLP_BATCH_SIZE = 50
+
+# Additional DBLP-specific output columns and the DBLP fields they come from
+DBLP_EXTRA_FIELDS = {
+    "dblp_key": "key",
+    "dblp_type": "type",
+    "dblp_ee": "ee",  # Electronic edition URL
+    "dblp_pages": "pages",
+    "dblp_volume": "volume",
+    "dblp_number": "number",
+    "dblp_publisher": "publisher",
+    "dblp_series": "series",
+}
+
+# On-disk response cache. Past years rarely change, so they are kept for a
+# week; the current year is still being indexed and expires after an hour.
+DBLP_CACHE_NAME = os.path.join('.http_cache', 'dblp')
+DBLP_CACHE_EXPIRE_AFTER = timedelta(days=7)
+DBLP_CURRENT_YEAR_EXPIRE_AFTER = timedelta(hours=1)
+
+# Smallest connection pool of a session (urllib3's default); more workers get
+# one keep-alive connection each
+DBLP_MIN_POOL_SIZE = 10
+
+# Overall request rate across all workers, kept polite to dblp.org
+DBLP_REQUESTS_PER_SECOND = 2.0
+
+# TLS context built once (loading the CA bundle is slow) and shared by every
+# connection pool. ALPN is left at HTTP/1.1, the only protocol urllib3 speaks.
+_TLS_CTX = ssl.create_default_context()
+_TLS_CTX.minimum_version = ssl.TLSVersion.TLSv1_2
+
+class TLSAdapter(HTTPAdapter):
+    """HTTPAdapter that connects with the shared TLS 1.2+ context."""
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _TLS_CTX
+        return super().init_poolmanager(*args, **kwargs)
+
 class DBLPAPIError(APIError):
     """Custom exception for DBLP API related errors."""
     pass
 
-def create_session():
-    """Create a requests session with SSL retry configuration."""
-    session = requests.Session()
+def create_session(max_retries: int = 10, pool_size: int = 10):
+    """
+    Create a requests session with SSL retry configuration.
+    Failed requests (including 429 and 5xx responses) are retried up to
+    max_retries times with exponential backoff, honouring Retry-After.
+    The connection pool keeps up to pool_size keep-alive connections to DBLP,
+    so each concurrent worker can reuse its own connection.
+    Responses are cached on disk, so re-running a query only hits DBLP for
+    pages that have expired (see DBLP_CACHE_EXPIRE_AFTER).
+    """
+    session = CachedSession(
+        DBLP_CACHE_NAME,
+        backend='sqlite',
+        expire_after=DBLP_CACHE_EXPIRE_AFTER,
+        cache_control=True,  # Honour ETag/Last-Modified and Cache-Control from DBLP
+        allowable_methods=('GET',),
+    )
     
     # Configure retry strategy for SSL issues with more aggressive settings
     retry_strategy = Retry(
-        total=10,  # Increased total retries
+        total=max_retries,
         backoff_factor=1,  # Reduced backoff factor for faster retries
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"],
+        respect_retry_after_header=True,
         # Add specific SSL error handling
         raise_on_redirect=False,
         raise_on_status=False
     )
     
-    class TLSAdapter(HTTPAdapter):
-        def init_poolmanager(self, *args, **kwargs):
-            context = ssl.create_default_context()
-            context.minimum_version = ssl.TLSVersion.TLSv1_2
-            kwargs['ssl_context'] = context
-            return super().init_poolmanager(*args, **kwargs)
-    adapter = TLSAdapter(max_retries=retry_strategy)
+    adapter = TLSAdapter(max_retries=retry_strategy, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
@@ -60,7 +119,7 @@ def create_session():
     session.headers.update({
         'User-Agent': 'SystematicReview/1.0 (DBLP API Client)',
         'Accept': 'application/json',
-        'Accept-Encoding': 'gzip, deflate',
+        'Accept-Encoding': ACCEPT_ENCODING,  # Includes br/zstd when their decoders are installed
         'Connection': 'keep-alive'
     })
     
@@ -81,8 +140,8 @@ def validate_dblp_response(response: requests.Response) -> Dict[str, Any]:
         
         # Parse JSON
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise ResponseError(f"Invalid JSON response: {e}")
         
         # Validate response structure
@@ -121,106 +180,130 @@ def validate_dblp_response(response: requests.Response) -> Dict[str, Any]:
     except RequestException as e:
         raise ResponseError(f"Network error: {e}")
 
-def validate_dblp_paper_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+def _fetch_dblp_batch(session: requests.Session, year_query: str, start_index: int,
+                      timeout: int, expire_after: timedelta, limiter: RateLimiter) -> Dict[str, Any]:
     """
-    Validate and clean a DBLP paper entry from the API response.
+    Fetch and validate a single page of DBLP search results.
+    Transient failures are retried by the session's adapter (see create_session).
     """
-    if not isinstance(entry, dict):
-        logging.warning(f"Invalid entry type: {type(entry)}")
-        return {}
-    
-    # Extract and validate required fields
-    paper = {}
+    url = "https://dblp.org/search/publ/api"
+    # Use session headers instead of creating new ones
+    params = {
+        "q": year_query,
+        "h": DBLP_BATCH_SIZE,
+        "f": start_index,  # First hit
+        "format": "json"
+    }
     
-    # DOI
-    doi = entry.get("doi")
-    if doi is not None and not isinstance(doi, str):
-        logging.warning(f"Invalid DOI type: {type(doi)}")
-        doi = None
-    paper["doi"] = doi
-    
-    # Title - required field
-    title = entry.get("title")
-    if not title or not isinstance(title, str):
-        logging.warning(f"Missing or invalid title: {title}")
-        paper["title"] = "Unknown Title"
-    else:
-        paper["title"] = title.strip()
-    
-    # Authors - DBLP provides authors as a list
-    authors = entry.get("authors", {}).get("author", [])
-    if authors and isinstance(authors, list):
-        # Join author names
-        author_names = []
-        for author in authors:
-            if isinstance(author, dict):
-                full_name = author.get("text", "")
-                if full_name:
-                    author_names.append(full_name)
-        paper["authors"] = "; ".join(author_names) if author_names else None
-    else:
-        paper["authors"] = None
-    
-    # Year - validate and convert
-    year_str = entry.get("year")
-    if year_str and isinstance(year_str, str):
-        try:
-            year = int(year_str)
-            if 1900 <= year <= 2030:  # Reasonable year range
-                paper["year"] = year
-            else:
-                logging.warning(f"Year out of reasonable range: {year}")
-                paper["year"] = None
-        except (ValueError, TypeError):
-            logging.warning(f"Invalid year format: {year_str}")
-            paper["year"] = None
-    else:
-        paper["year"] = None
+    limiter.wait()
+    try:
+        response = session.get(url, params=params, timeout=timeout, expire_after=expire_after)
+    except RequestException as e:
+        # Only raised once the adapter has used up its retries
+        raise DBLPAPIError(f"Request failed: {e}")
+    limiter.update(response)
     
-    # Publication name
-    pub_name = entry.get("venue")
-    if pub_name and isinstance(pub_name, str):
-        paper["publicationName"] = pub_name.strip()
-    else:
-        paper["publicationName"] = None
+    # Validate DBLP specific response
+    data = validate_dblp_response(response)
+    if start_index == 0 and log.isEnabledFor(logging.DEBUG):
+        log.debug("Response Content-Encoding: %s", response.headers.get('Content-Encoding', 'identity'))
+    return data
+
+def _join_dblp_authors(authors: Any) -> Optional[str]:
+    """
+    Join the author names of a DBLP ``authors`` object.
+    """
+    author_list = authors.get("author", []) if isinstance(authors, dict) else []
+    if not author_list or not isinstance(author_list, list):
+        return None
+    author_names = [author.get("text", "") for author in author_list if isinstance(author, dict)]
+    author_names = [name for name in author_names if name]
+    return "; ".join(author_names) if author_names else None
+
+def _join_dblp_values(value: Any) -> Any:
+    """
+    Join a DBLP field that lists several values (e.g. ``ee`` for papers with
+    several electronic editions, or ``venue``) into one "; "-separated string.
+    """
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value if item is not None)
+    return value
+
+def _normalize_dblp_batch(infos: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Validate and clean a batch of DBLP entries column-wise.
+    Produces the standard paper columns (doi, title, authors, year,
+    publicationName, url, citedby-count) plus DBLP_EXTRA_FIELDS; missing or
+    malformed values become None (titles "Unknown Title"), and years outside
+    1900-2030 are dropped.
+    """
+    raw = pd.DataFrame.from_records([info for info in infos if isinstance(info, dict)])
     
-    # URL
-    url = entry.get("url")
-    if url and isinstance(url, str):
-        paper["url"] = url.strip()
-    else:
-        paper["url"] = None
+    papers = pd.DataFrame(index=raw.index)
+    papers["doi"] = clean_text_column(frame_column(raw, "doi"))
+    papers["title"] = clean_text_column(frame_column(raw, "title")).fillna("Unknown Title")
+    papers["authors"] = frame_column(raw, "authors").map(_join_dblp_authors)  # Nested list, still per row
+    papers["year"] = clean_year_column(frame_column(raw, "year"))
+    papers["publicationName"] = clean_text_column(frame_column(raw, "venue").map(_join_dblp_values))
+    papers["url"] = clean_text_column(frame_column(raw, "url"))
     
     # Citation count (DBLP doesn't provide citation counts)
-    paper["citedby-count"] = 0
+    papers["citedby-count"] = 0
+    
+    # Additional DBLP-specific fields; list values are joined so each
+    # column holds one type (Parquet cannot store mixed strings and lists)
+    for column, field in DBLP_EXTRA_FIELDS.items():
+        papers[column] = frame_column(raw, field).map(_join_dblp_values)
     
-    # Additional DBLP-specific fields
-    paper["dblp_key"] = entry.get("key")
-    paper["dblp_type"] = entry.get("type")
-    paper["dblp_ee"] = entry.get("ee")  # Electronic edition URL
-    paper["dblp_pages"] = entry.get("pages")
-    paper["dblp_volume"] = entry.get("volume")
-    paper["dblp_number"] = entry.get("number")
-    paper["dblp_publisher"] = entry.get("publisher")
-    paper["dblp_series"] = entry.get("series")
+    return papers
+
+@functools.lru_cache(maxsize=8192)
+def _casefold(text: str) -> str:
+    """
+    Casefold a venue name. Cached, since every hit from a venue repeats it.
+    """
+    return text.casefold()
+
+def _extract_dblp_papers(hits: List[Dict[str, Any]], venue_lower: Optional[str]) -> pd.DataFrame:
+    """
+    Validate DBLP hits and keep only papers published in the target venue.
+    venue_lower is the casefolded venue name; if it is None, all hits are kept.
+    """
+    papers = _normalize_dblp_batch([hit.get('info', {}) for hit in hits if isinstance(hit, dict)])
+    if venue_lower is None:
+        return papers
     
-    return paper
+    # The query already filters by venue; this is a cheap guard against
+    # hits that only matched the venue name loosely
+    in_venue = pd.Series(
+        [venue_lower in _casefold(name) for name in papers["publicationName"].fillna("")],
+        index=papers.index, dtype=bool
+    )
+    if log.isEnabledFor(logging.DEBUG) and not in_venue.all():
+        log.debug("Skipping %s papers from other venues", int((~in_venue).sum()))
+    return papers[in_venue]
 
 def get_dblp_venue(query: str, venue: str, start_year: int, end_year: int, 
-                   output_dir: str = 'output', timeout: int = 30, max_retries: int = 3, 
-                   save_bibtex_format: bool = True) -> pd.DataFrame:
+                   output_dir: str = 'output', timeout: int = 30, max_retries: int = 10, 
+                   save_bibtex_format: bool = True, save_parquet: bool = True, max_workers: int = 8,
+                   stream_id: Optional[str] = None) -> pd.DataFrame:
     """
     Fetch papers from DBLP API for a specific venue with year-by-year search.
+    Years and their result pages are fetched concurrently over a shared session.
     
     Parameters:
     - query: str, the search query (e.g., "multivariate")
     - venue: str, the target venue (e.g., "EuroVis", "Eurographics")
     - start_year: int, starting publication year (inclusive)
     - end_year: int, ending publication year (inclusive)
-    - output_dir: str, base directory for outputs
+    - output_dir: str, base directory for outputs, relative to this script's folder
     - timeout: int, request timeout in seconds
     - max_retries: int, maximum number of retries for failed requests
     - save_bibtex_format: bool, whether to save BibTeX format output
+    - save_parquet: bool, whether to also save a Parquet copy of the CSV output
+    - max_workers: int, maximum number of concurrent requests
+    - stream_id: str, optional DBLP stream (e.g., "conf/eurovis") to search
+      instead of the venue name; venue is then only used for file names
     """
     # Input validation
     if not isinstance(query, str) or len(query.strip()) == 0:
@@ -229,155 +312,123 @@ def get_dblp_venue(query: str, venue: str, start_year: int, end_year: int,
         raise ValueError("Venue must be a non-empty string.")
     if not (isinstance(start_year, int) and isinstance(end_year, int) and start_year <= end_year):
         raise ValueError("start_year and end_year must be integers with start_year <= end_year.")
+    if not isinstance(save_parquet, bool):
+        raise ValueError("save_parquet must be a boolean.")
+    if not (isinstance(max_workers, int) and max_workers > 0):
+        raise ValueError("max_workers must be a positive integer.")
+    
+    if stream_id is not None and (not isinstance(stream_id, str) or len(stream_id.strip()) == 0):
+        raise ValueError("stream_id must be a non-empty string or None.")
     
     # Clean inputs
     query = query.strip()
     venue = venue.strip()
+    stream_id = stream_id.strip() if stream_id else None
     
-    logging.info(f"Starting DBLP search for venue '{venue}' for years: {start_year}-{end_year}, query: {query}")
+    # Let DBLP filter by venue server-side instead of discarding hits locally.
+    # A venue: prefix only applies to one word, so multi-word venues (e.g.
+    # "IEEE Trans. Vis. Comput. Graph.") get one per word; the matches are
+    # prefix matches, and the local check drops hits from other venues.
+    if stream_id:
+        venue_token = f"streamid:{stream_id}:"
+        check_venue = None
+    else:
+        venue_token = " ".join(f"venue:{word}" for word in venue.split())
+        check_venue = venue.casefold()
+    
+    log.info("Starting DBLP search for venue '%s' for years: %s-%s, query: %s", venue, start_year, end_year, query)
     
     # Prepare output folder
     try:
-        output_folder = os.path.join(os.getcwd(), output_dir, "dblp")
-        os.makedirs(output_folder, exist_ok=True)
+        output_folder = _MODULE_DIR / output_dir / "dblp"
+        output_folder.mkdir(parents=True, exist_ok=True)
     except OSError as e:
         raise ValueError(f"Cannot create output directory: {e}")
     
-    all_papers = []  # Accumulate all papers in memory
+    papers_by_batch = {}  # (year, start_index) -> papers, reassembled in order below
     
-    # Create session with SSL retry configuration
-    session = create_session()
+    # Create session with SSL retry configuration, shared by all workers
+    session = create_session(max_retries, pool_size=max(max_workers, DBLP_MIN_POOL_SIZE))
+    limiter = RateLimiter(DBLP_REQUESTS_PER_SECOND)
     
-    # Search year by year to avoid complex query syntax issues
-    for year in range(start_year, end_year + 1):
-        logging.info(f"Searching year {year} for venue '{venue}'...")
-        
-        # Build query for this year with venue filter
-        year_query = f"{query} {venue} year:{year}"
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Search year by year to avoid complex query syntax issues.
+        # The first batch of each year reports how many hits remain.
+        pending = {}  # future -> (year, year_query, expire_after, start_index)
+        for year in range(start_year, end_year + 1):
+            log.info("Searching year %s for venue '%s'...", year, venue)
+            year_query = f"{query} {venue_token} year:{year}"
+            if year >= date.today().year:
+                expire_after = DBLP_CURRENT_YEAR_EXPIRE_AFTER
+            else:
+                expire_after = DBLP_CACHE_EXPIRE_AFTER
+            future = executor.submit(_fetch_dblp_batch, session, year_query, 0, timeout, expire_after, limiter)
+            pending[future] = (year, year_query, expire_after, 0)
         
-        start_index = 0  # DBLP uses 0-based indexing
-        batch = 1
-        consecutive_errors = 0
-        max_consecutive_errors = 3
-        done = False
-        while True:
-            logging.info(f"   Fetching batch {batch}, start_index: {start_index} for year {year}")
-            url = "https://dblp.org/search/publ/api"
-            # Use session headers instead of creating new ones
-            params = {
-                "q": year_query,
-                "h": 50,  # Further reduced batch size to avoid SSL issues
-                "f": start_index,  # First hit
-                "format": "json"
-            }
-            
-            retries = max_retries
-            while retries >= 0:
+        # Workers only fetch and parse; batches are normalised here as soon as
+        # any of them finishes, overlapping with the requests still in flight
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                year, year_query, expire_after, start_index = pending.pop(future)
                 try:
-                    response = session.get(url, params=params, timeout=timeout)
-                    
-                    # Validate DBLP specific response
-                    data = validate_dblp_response(response)
-                    
-                    # Check rate limit headers
-                    remaining = response.headers.get('X-RateLimit-Remaining')
-                    if remaining and int(remaining) < 10:
-                        logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                        time.sleep(10)
-                    
-                    hits = data.get('result', {}).get('hits', {}).get('hit', [])
-                    total_results = int(data.get('result', {}).get('hits', {}).get('@total', 0))
-                    batch_size = params["h"] if "h" in params else 50
-
-                    valid_papers = 0
-                    for hit in hits:
-                        try:
-                            info = hit.get('info', {})
-                            paper = validate_dblp_paper_entry(info)
-                            
-                            # Additional venue filtering to ensure we get the right venue
-                            paper_venue = paper.get('publicationName', '')
-                            if paper and venue.lower() in paper_venue.lower():
-                                all_papers.append(paper)
-                                valid_papers += 1
-                            elif paper:
-                                logging.debug(f"Skipping paper from venue: {paper_venue}")
-                                
-                        except Exception as e:
-                            logging.warning(f"Failed to process hit entry: {e}")
-                            continue
-
-                    start_index += len(hits)
-                    logging.info(f"Fetched {len(hits)} hits, {valid_papers} valid for year {year}. Total so far: {len(all_papers)}. Next start: {start_index}/{total_results}")
-
-                    # Break if fewer hits than batch size (last page)
-                    if len(hits) < batch_size:
-                        logging.info(f"Fetched final batch for year {year} (less than batch size).")
-                        done = True
-                        consecutive_errors = 0
-                        break
-                    else:
-                        done = False
-                        consecutive_errors = 0
-                        time.sleep(3)
-                        break
+                    data = future.result()
+                except APIError as e:
+                    # Retries are exhausted; move on to the other batches
+                    log.error("Skipping year %s from start_index %s: %s", year, start_index, e)
+                    continue
+                hits = data.get('result', {}).get('hits', {}).get('hit', [])
+                papers_by_batch[(year, start_index)] = _extract_dblp_papers(hits, check_venue)
+                if start_index > 0:
+                    log.info("Fetched %s hits, %s valid for year %s at start_index %s.", len(hits), len(papers_by_batch[(year, start_index)]), year, start_index)
+                    continue
+                
+                total_results = int(data.get('result', {}).get('hits', {}).get('@total', 0))
+                log.info("Fetched %s hits, %s valid for year %s. Total available: %s", len(hits), len(papers_by_batch[(year, 0)]), year, total_results)
                 
-                except RateLimitError as e:
-                    logging.error(f"Rate limit exceeded: {e}")
-                    time.sleep(60)  # Wait 1 minute before retry
-                    retries -= 1
-                    if retries < 0:
-                        raise DBLPAPIError(f"Rate limit exceeded: {e}")
-                        
-                except ResponseError as e:
-                    logging.error(f"API response error: {e}")
-                    retries -= 1
-                    consecutive_errors += 1
-                    if consecutive_errors >= max_consecutive_errors:
-                        raise DBLPAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                    time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                    if retries < 0:
-                        raise DBLPAPIError(f"API response error: {e}")
-                        
-                except Exception as e:
-                    logging.error(f"Unexpected error: {e}")
-                    retries -= 1
-                    consecutive_errors += 1
-                    if consecutive_errors >= max_consecutive_errors:
-                        raise DBLPAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                    time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                    if retries < 0:
-                        raise DBLPAPIError(f"Unexpected error: {e}")
-            
-            batch += 1
-            if done:
-                break
+                # Fewer hits than batch size means this was the last page
+                if len(hits) < DBLP_BATCH_SIZE:
+                    continue
+                for next_index in range(DBLP_BATCH_SIZE, total_results, DBLP_BATCH_SIZE):
+                    log.info("   Fetching start_index: %s for year %s", next_index, year)
+                    future = executor.submit(_fetch_dblp_batch, session, year_query, next_index, timeout, expire_after, limiter)
+                    pending[future] = (year, year_query, expire_after, next_index)
     
-    if not all_papers:
-        logging.info("No papers found.")
+    # Concatenate the per-batch frames in year/page order, dropping repeated
+    # DOIs in that order so the same copy is kept on every run
+    seen = set()  # DOIs of papers collected so far
+    batches = [drop_seen_papers(papers_by_batch[batch_key], seen) for batch_key in sorted(papers_by_batch)]
+    batches = [batch for batch in batches if not batch.empty]
+    if not batches:
+        log.info("No papers found.")
         return pd.DataFrame()
+    all_papers = pd.concat(batches, ignore_index=True)
     
     # Create DataFrame, de-dupe by DOI, save to CSV and BibTeX
     try:
         # Save to CSV
         csv_filename = f'dblp_{venue.replace(" ", "_")}_{start_year}_{end_year}.csv'
-        csv_path = os.path.join(output_folder, csv_filename)
+        csv_path = output_folder / csv_filename
         final_df = save_results_to_csv(all_papers, csv_path)
         
         # Save to BibTeX if requested
         if save_bibtex_format:
             bibtex_filename = f'dblp_{venue.replace(" ", "_")}_{start_year}_{end_year}.bib'
-            bibtex_path = os.path.join(output_folder, bibtex_filename)
+            bibtex_path = output_folder / bibtex_filename
             save_bibtex(all_papers, bibtex_path)
         
-        logging.info(f"Total unique papers found: {len(final_df)}. Saved to {csv_filename}")
+        # Save a typed Parquet copy alongside the CSV
+        if save_parquet:
+            save_results_to_parquet(final_df, csv_path.with_suffix('.parquet'))
+        
+        log.info("Total unique papers found: %s. Saved to %s", len(final_df), csv_filename)
         if save_bibtex_format:
-            logging.info(f"BibTeX file saved to: {bibtex_filename}")
+            log.info("BibTeX file saved to: %s", bibtex_filename)
         
         return final_df
         
     except Exception as e:
-        logging.error(f"Error processing results: {e}")
+        log.error("Error processing results: %s", e)
         raise DBLPAPIError(f"Failed to process results: {e}")
 
 if __name__ == "__main__":
@@ -391,11 +442,11 @@ if __name__ == "__main__":
         # Save both CSV and BibTeX formats
         get_dblp_venue(example_query, example_venue, example_start_year, example_end_year, save_bibtex_format=True)
     except DBLPAPIError as e:
-        logging.error(f"DBLP API error: {e}")
+        log.error("DBLP API error: %s", e)
         sys.exit(1)
     except ValueError as e:
-        logging.error(f"Invalid input: {e}")
+        log.error("Invalid input: %s", e)
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
+        log.error("Unexpected error: %s", e)
         sys.exit(1) 
\ No newline at end of file
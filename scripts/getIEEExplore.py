@@ -1,30 +1,72 @@
 import os
+from pathlib import Path
 import sys
-import json
+import orjson
 import requests
 import pandas as pd
-import time
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
 from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from utils.api_utils import (
-    APIError, ResponseError, RateLimitError,
-    validate_api_response, validate_paper_entry,
-    save_bibtex, save_results_to_csv, make_api_request
+    APIError, ResponseError, RateLimitError, RateLimiter,
+    save_bibtex as write_bibtex, save_results_to_csv, save_results_to_parquet, make_api_request,
+    frame_column, clean_text_column, clean_year_column, drop_seen_papers
 )
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
+
+log = logging.getLogger(__name__)
+
+# Relative output directories are resolved against this script's folder,
+# so results land in the same place whatever the working directory is
+_MODULE_DIR = Path(__file__).resolve().parent
+
 API_KEY = os.getenv("IEEEXploreAPIKey")
 if not API_KEY:
-    logging.error("IEEE Xplore API key not found in environment variables.")
+    log.error("IEEE Xplore API key not found in environment variables.")
     raise ValueError("IEEE Xplore API key not found. Please set IEEEXploreAPIKey in .env file.")
 
 class IEEEXploreAPIError(APIError):
     """Custom exception for IEEE Xplore API related errors."""
     pass
 
+def create_session() -> requests.Session:
+    """Create a pooled keep-alive session for IEEE Xplore requests."""
+    session = requests.Session()
+    
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    session.verify = True  # Enable SSL verification
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,  # Includes br/zstd when their decoders are installed
+        'Connection': 'keep-alive'
+    })
+    
+    return session
+
+# IEEE Xplore max records per request
+IEEE_PAGE_SIZE = 200
+
+# Overall request rate across all workers; the API allows up to 10 calls/s
+IEEE_REQUESTS_PER_SECOND = 5.0
+
+# Shared by every page and every call so the TCP/TLS connection is reused
+_IEEE_SESSION = create_session()
+
 def validate_ieee_response(response: requests.Response) -> Dict[str, Any]:
     """
     Validate and parse IEEE Xplore API response.
@@ -50,8 +92,8 @@ def validate_ieee_response(response: requests.Response) -> Dict[str, Any]:
         
         # Parse JSON
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise ResponseError(f"Invalid JSON response: {e}")
         
         # Validate response structure
@@ -86,115 +128,117 @@ def validate_ieee_response(response: requests.Response) -> Dict[str, Any]:
     except RequestException as e:
         raise ResponseError(f"Network error: {e}")
 
-def validate_ieee_paper_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+def _fetch_ieee_page(full_query: str, page: int, timeout: int, max_retries: int,
+                     limiter: RateLimiter) -> Dict[str, Any]:
     """
-    Validate and clean an IEEE Xplore paper entry from the API response.
+    Fetch and validate one page of IEEE Xplore results, retrying on errors.
     
     Args:
-        entry: Raw paper entry from IEEE Xplore API
+        full_query: Complete IEEE Xplore query text
+        page: 1-based page number
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries
+        limiter: Rate limiter shared by all page workers
         
     Returns:
-        Cleaned paper dictionary
+        Dict containing parsed JSON data
     """
-    if not isinstance(entry, dict):
-        logging.warning(f"Invalid entry type: {type(entry)}")
-        return {}
-    
-    # Extract and validate required fields
-    paper = {}
-    
-    # DOI
-    doi = entry.get("doi")
-    if doi is not None and not isinstance(doi, str):
-        logging.warning(f"Invalid DOI type: {type(doi)}")
-        doi = None
-    paper["doi"] = doi
-    
-    # Title - required field
-    title = entry.get("title")
-    if not title or not isinstance(title, str):
-        logging.warning(f"Missing or invalid title: {title}")
-        paper["title"] = "Unknown Title"
-    else:
-        paper["title"] = title.strip()
-    
-    # Authors - IEEE Xplore provides authors as a list
-    authors = entry.get("authors", {}).get("authors", [])
-    if authors and isinstance(authors, list):
-        # Join author names
-        author_names = []
-        for author in authors:
-            if isinstance(author, dict):
-                full_name = author.get("full_name", "")
-                if full_name:
-                    author_names.append(full_name)
-        paper["authors"] = "; ".join(author_names) if author_names else None
-    else:
-        paper["authors"] = None
-    
-    # Year - validate and convert
-    year_str = entry.get("publication_year")
-    if year_str and isinstance(year_str, str):
-        try:
-            year = int(year_str)
-            if 1900 <= year <= 2030:  # Reasonable year range
-                paper["year"] = year
-            else:
-                logging.warning(f"Year out of reasonable range: {year}")
-                paper["year"] = None
-        except (ValueError, TypeError):
-            logging.warning(f"Invalid year format: {year_str}")
-            paper["year"] = None
-    else:
-        paper["year"] = None
+    url = "https://ieeexplore.ieee.org/rest/search"
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "X-API-Key": API_KEY
+    }
+    params = {
+        "querytext": full_query,
+        "highlight": True,
+        "returnFacets": ["ALL"],
+        "returnType": "SEARCH",
+        "pageNumber": page,
+        "max_records": IEEE_PAGE_SIZE
+    }
     
-    # Publication name
-    pub_name = entry.get("publication_title")
-    if pub_name and isinstance(pub_name, str):
-        paper["publicationName"] = pub_name.strip()
-    else:
-        paper["publicationName"] = None
+    # make_api_request retries through the shared limiter, so a rate-limit
+    # wait holds back every page worker together
+    try:
+        response = make_api_request(url, headers, params, timeout, max_retries,
+                                    session=_IEEE_SESSION, limiter=limiter)
+        
+        # Validate IEEE Xplore specific response
+        data = validate_ieee_response(response)
+    except (APIError, RequestException) as e:
+        raise IEEEXploreAPIError(f"Failed to fetch page {page}: {e}")
     
-    # URL
-    url = entry.get("pdf_url") or entry.get("article_url")
-    if url and isinstance(url, str):
-        paper["url"] = url.strip()
-    else:
-        paper["url"] = None
+    if page == 1 and log.isEnabledFor(logging.DEBUG):
+        log.debug("Response Content-Encoding: %s", response.headers.get('Content-Encoding', 'identity'))
+    return data
+
+def _join_ieee_authors(authors: Any) -> Optional[str]:
+    """
+    Join the author names of an IEEE Xplore ``authors`` object.
+    """
+    author_list = authors.get("authors", []) if isinstance(authors, dict) else []
+    if not author_list or not isinstance(author_list, list):
+        return None
+    author_names = [author.get("full_name", "") for author in author_list if isinstance(author, dict)]
+    author_names = [name for name in author_names if name]
+    return "; ".join(author_names) if author_names else None
+
+def _ieee_keywords(index_terms: Any) -> List[str]:
+    """
+    Extract the IEEE terms from an IEEE Xplore ``index_terms`` object.
+    """
+    if not isinstance(index_terms, dict):
+        return []
+    return index_terms.get("ieee_terms", {}).get("terms", [])
+
+def _extract_ieee_papers(articles: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Validate and clean a page of IEEE Xplore articles column-wise.
+    Produces the standard paper columns (doi, title, authors, year,
+    publicationName, url, citedby-count) plus the ieee_* fields; missing or
+    malformed values become None (titles "Unknown Title"), and years outside
+    1900-2030 are dropped.
+    """
+    raw = pd.DataFrame.from_records([article for article in articles if isinstance(article, dict)])
     
-    # Citation count
-    cited_count = entry.get("citing_paper_count")
-    if cited_count is not None:
-        try:
-            paper["citedby-count"] = int(cited_count)
-        except (ValueError, TypeError):
-            logging.warning(f"Invalid citation count: {cited_count}")
-            paper["citedby-count"] = 0
-    else:
-        paper["citedby-count"] = 0
+    papers = pd.DataFrame(index=raw.index)
+    papers["doi"] = clean_text_column(frame_column(raw, "doi"))
+    papers["title"] = clean_text_column(frame_column(raw, "title")).fillna("Unknown Title")
+    papers["authors"] = frame_column(raw, "authors").map(_join_ieee_authors)  # Nested list, still per row
+    papers["year"] = clean_year_column(frame_column(raw, "publication_year"))
+    papers["publicationName"] = clean_text_column(frame_column(raw, "publication_title"))
+    papers["url"] = clean_text_column(frame_column(raw, "pdf_url")).fillna(
+        clean_text_column(frame_column(raw, "article_url")))
+    cited_count = pd.to_numeric(frame_column(raw, "citing_paper_count"), errors="coerce")
+    papers["citedby-count"] = cited_count.fillna(0).astype(int)
     
     # Additional IEEE-specific fields
-    paper["ieee_article_number"] = entry.get("article_number")
-    paper["ieee_pdf_url"] = entry.get("pdf_url")
-    paper["ieee_abstract"] = entry.get("abstract")
-    paper["ieee_keywords"] = entry.get("index_terms", {}).get("ieee_terms", {}).get("terms", [])
+    papers["ieee_article_number"] = frame_column(raw, "article_number")
+    papers["ieee_pdf_url"] = frame_column(raw, "pdf_url")
+    papers["ieee_abstract"] = frame_column(raw, "abstract")
+    papers["ieee_keywords"] = frame_column(raw, "index_terms").map(_ieee_keywords)
     
-    return paper
+    return papers
 
 def get_ieee_xplore(query: str, start_year: int, end_year: int, output_dir: str = 'output', 
-                    timeout: int = 30, max_retries: int = 3, save_bibtex: bool = True) -> pd.DataFrame:
+                    timeout: int = 30, max_retries: int = 3, save_bibtex: bool = True,
+                    save_parquet: bool = True, max_workers: int = 8) -> pd.DataFrame:
     """
     Fetch papers from IEEE Xplore API for given query and year range.
     Returns a DataFrame of unique papers and saves to CSV and optionally BibTeX.
+    The first page is fetched alone; the remaining pages are fetched concurrently.
     
     Parameters:
     - query: str, the search query
     - start_year: int, starting publication year (inclusive)
     - end_year: int, ending publication year (inclusive)
-    - output_dir: str, base directory for outputs
+    - output_dir: str, base directory for outputs, relative to this script's folder
     - timeout: int, request timeout in seconds
     - max_retries: int, maximum number of retries for failed requests
     - save_bibtex: bool, whether to save BibTeX format output
+    - save_parquet: bool, whether to also save a Parquet copy of the CSV output
+    - max_workers: int, maximum number of concurrent page requests
     
     Raises ValueError on invalid inputs.
     """
@@ -209,139 +253,94 @@ def get_ieee_xplore(query: str, start_year: int, end_year: int, output_dir: str
         raise ValueError("max_retries must be a non-negative integer.")
     if not isinstance(save_bibtex, bool):
         raise ValueError("save_bibtex must be a boolean.")
+    if not isinstance(save_parquet, bool):
+        raise ValueError("save_parquet must be a boolean.")
+    if not (isinstance(max_workers, int) and max_workers > 0):
+        raise ValueError("max_workers must be a positive integer.")
     
     # Clean inputs
     query = query.strip()
     
-    logging.info(f"Starting IEEE Xplore search for years: {start_year}-{end_year}, query: {query}")
+    log.info("Starting IEEE Xplore search for years: %s-%s, query: %s", start_year, end_year, query)
     
     # Prepare output folder
     try:
-        output_folder = os.path.join(os.getcwd(), output_dir, "ieee_xplore")
-        os.makedirs(output_folder, exist_ok=True)
+        output_folder = _MODULE_DIR / output_dir / "ieee_xplore"
+        output_folder.mkdir(parents=True, exist_ok=True)
     except OSError as e:
         raise ValueError(f"Cannot create output directory: {e}")
     
-    all_papers = []  # Accumulate all papers in memory
-    
     # Build query with year range
     full_query = f'("{query}") AND ({start_year} <= publication_year <= {end_year})'
-    logging.info(f"Processing query: {full_query}")
+    log.info("Processing query: %s", full_query)
     
-    start_index = 1  # IEEE Xplore uses 1-based indexing
-    batch = 1
-    consecutive_errors = 0
-    max_consecutive_errors = 3
+    # Shared by all page workers so the overall request rate stays within quota
+    limiter = RateLimiter(IEEE_REQUESTS_PER_SECOND)
     
-    while True:
-        logging.info(f"   Fetching batch {batch}, start_index: {start_index}")
-        url = "https://ieeexplore.ieee.org/rest/search"
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "X-API-Key": API_KEY
-        }
-        params = {
-            "querytext": full_query,
-            "highlight": True,
-            "returnFacets": ["ALL"],
-            "returnType": "SEARCH",
-            "pageNumber": start_index,
-            "max_records": 200  # IEEE Xplore max per request
-        }
-        
-        retries = max_retries
-        while retries >= 0:
+    # The first page tells us how many pages there are
+    log.info("   Fetching page 1")
+    data = _fetch_ieee_page(full_query, 1, timeout, max_retries, limiter)
+    articles = data.get('articles', [])
+    papers_by_page = {1: _extract_ieee_papers(articles)}
+    total_results = int(data.get('totalRecords', 0))
+    # Ceiling division: a full last page must not add an extra, empty request
+    last_page = math.ceil(total_results / IEEE_PAGE_SIZE)
+    log.info("Fetched %s articles, %s valid. Total available: %s, pages: %s", len(articles), len(papers_by_page[1]), total_results, last_page)
+    
+    if not articles:
+        log.info("No more articles found.")
+    elif last_page > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_fetch_ieee_page, full_query, page, timeout, max_retries, limiter): page
+                for page in range(2, last_page + 1)
+            }
             try:
-                response = make_api_request(url, headers, params, timeout, max_retries)
-                
-                # Validate IEEE Xplore specific response
-                data = validate_ieee_response(response)
-                
-                # Check rate limit headers
-                remaining = response.headers.get('X-RateLimit-Remaining')
-                if remaining and int(remaining) < 10:
-                    logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                    time.sleep(10)
-                
-                articles = data.get('articles', [])
-                if not articles:
-                    logging.info("No more articles found.")
-                    break
-                
-                # Validate and extract papers
-                valid_papers = 0
-                for article in articles:
-                    try:
-                        paper = validate_ieee_paper_entry(article)
-                        if paper:  # Only add if validation passed
-                            all_papers.append(paper)
-                            valid_papers += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to process article entry: {e}")
-                        continue
-                
-                total_results = int(data.get('totalRecords', 0))
-                start_index += 1  # IEEE Xplore uses page numbers
-                logging.info(f"Fetched {len(articles)} articles, {valid_papers} valid. Total so far: {len(all_papers)}. Next page: {start_index}")
-                
-                if start_index > (total_results // 200) + 1:  # Check if we've reached the end
-                    break
-                
-                consecutive_errors = 0  # Reset error counter on success
-                time.sleep(1)  # Short sleep between pages
-                break  # Successful fetch, exit retry loop
-            
-            except RateLimitError as e:
-                logging.error(f"Rate limit exceeded: {e}")
-                time.sleep(60)  # Wait 1 minute before retry
-                retries -= 1
-                if retries < 0:
-                    raise IEEEXploreAPIError(f"Rate limit exceeded: {e}")
-                    
-            except ResponseError as e:
-                logging.error(f"API response error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise IEEEXploreAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise IEEEXploreAPIError(f"API response error: {e}")
-                    
-            except Exception as e:
-                logging.error(f"Unexpected error: {e}")
-                retries -= 1
-                if retries < 0:
-                    raise IEEEXploreAPIError(f"Unexpected error: {e}")
-        
-        batch += 1
+                for future in as_completed(futures):
+                    page = futures[future]
+                    articles = future.result().get('articles', [])
+                    papers_by_page[page] = _extract_ieee_papers(articles)
+                    log.info("Fetched %s articles, %s valid on page %s/%s", len(articles), len(papers_by_page[page]), page, last_page)
+            except IEEEXploreAPIError:
+                # Don't wait for queued pages once one has failed for good
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
     
-    if not all_papers:
-        logging.info("No papers found.")
+    # Concatenate the per-page frames in page order, dropping repeated DOIs
+    # in that order so the same copy is kept on every run
+    seen = set()  # DOIs of papers collected so far
+    pages = [drop_seen_papers(papers_by_page[page], seen) for page in sorted(papers_by_page)]
+    pages = [papers for papers in pages if not papers.empty]
+    if not pages:
+        log.info("No papers found.")
         return pd.DataFrame()
+    all_papers = pd.concat(pages, ignore_index=True)
     
     # Create DataFrame, de-dupe by DOI, save to CSV and BibTeX
     try:
         # Save to CSV
         csv_filename = f'ieee_papers_{start_year}_{end_year}.csv'
-        csv_path = os.path.join(output_folder, csv_filename)
+        csv_path = output_folder / csv_filename
         final_df = save_results_to_csv(all_papers, csv_path)
         
+        # Save a typed Parquet copy alongside the CSV
+        if save_parquet:
+            save_results_to_parquet(final_df, csv_path.with_suffix('.parquet'))
+        
         # Save to BibTeX if requested
         if save_bibtex:
             bibtex_filename = f'ieee_papers_{start_year}_{end_year}.bib'
-            bibtex_path = os.path.join(output_folder, bibtex_filename)
-            save_bibtex(all_papers, bibtex_path)
+            bibtex_path = output_folder / bibtex_filename
+            write_bibtex(all_papers, bibtex_path)
         
-        logging.info(f"Total unique papers found: {len(final_df)}. Saved to {csv_filename}")
+        log.info("Total unique papers found: %s. Saved to %s", len(final_df), csv_filename)
         if save_bibtex:
-            logging.info(f"BibTeX file saved to: {bibtex_filename}")
+            log.info("BibTeX file saved to: %s", bibtex_filename)
         
         return final_df
         
     except Exception as e:
-        logging.error(f"Error processing results: {e}")
+        log.error("Error processing results: %s", e)
         raise IEEEXploreAPIError(f"Failed to process results: {e}")
 
 if __name__ == "__main__":
@@ -354,11 +353,11 @@ if __name__ == "__main__":
         # Save both CSV and BibTeX formats
         get_ieee_xplore(example_query, example_start_year, example_end_year, save_bibtex=True)
     except IEEEXploreAPIError as e:
-        logging.error(f"IEEE Xplore API error: {e}")
+        log.error("IEEE Xplore API error: %s", e)
         sys.exit(1)
     except ValueError as e:
-        logging.error(f"Invalid input: {e}")
+        log.error("Invalid input: %s", e)
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
+        log.error("Unexpected error: %s", e)
         sys.exit(1) 
\ No newline at end of file
@@ -1,17 +1,22 @@
 import os
 import sys
-import json
+import orjson
 import requests
 import pandas as pd
-import time
 import logging
 import re
-from typing import Dict, List, Optional, Any
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any
 from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from requests_cache import CachedSession
 from utils.api_utils import (
-    APIError, ResponseError, RateLimitError,
-    validate_api_response, validate_paper_entry,
-    save_bibtex, save_results_to_csv, make_api_request
+    APIError, ResponseError, RateLimitError, RateLimiter,
+    save_bibtex as write_bibtex, save_results_to_csv, save_results_to_parquet,
+    PaperStreamWriter, frame_column, clean_text_column, clean_year_column, drop_seen_papers
 )
 from dotenv import load_dotenv
 
@@ -19,11 +24,80 @@ from dotenv import load_dotenv
 load_dotenv()
 # OpenAlex doesn't require an API key, but we can use one for higher rate limits
 API_KEY = os.getenv("OpenAlexAPIKey")  # Optional
+# A contact email routes requests to OpenAlex's faster "polite pool"
+MAILTO = os.getenv("OpenAlexMailto")  # Optional
+
+# Results per page (the OpenAlex maximum)
+OPENALEX_PAGE_SIZE = 200
+
+# Work fields requested from OpenAlex; everything else is left out of the
+# response. OpenAlex only accepts root-level fields here.
+OPENALEX_SELECT_FIELDS = ",".join([
+    "id", "doi", "title", "authorships", "publication_date",
+    "primary_location", "cited_by_count",
+])
+
+# Overall request rate; OpenAlex allows 10 requests/s. Once no more than
+# OPENALEX_LOW_QUOTA requests remain, each one waits OPENALEX_LOW_QUOTA_WAIT
+# seconds for the quota to recover, like the Scopus and Springer fetchers.
+OPENALEX_REQUESTS_PER_SECOND = 8.0
+OPENALEX_LOW_QUOTA = 9
+OPENALEX_LOW_QUOTA_WAIT = 10.0
+
+# On-disk response cache, so re-running a query while refining a review
+# doesn't hit OpenAlex again within a day
+OPENALEX_CACHE_NAME = os.path.join('.http_cache', 'openalex')
+OPENALEX_CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+# ISSN venue filters (e.g. "0317-7173") and filename sanitising
+_ISSN_RE = re.compile(r'^\d{4}-\d{3}[\dX]$')
+_NON_WORD_RE = re.compile(r'[^\w]')
 
 class OpenAlexAPIError(APIError):
     """Custom exception for OpenAlex API related errors."""
     pass
 
+def create_session(max_retries: int = 3) -> requests.Session:
+    """
+    Create a pooled keep-alive session for OpenAlex requests.
+    Failed requests (including 429 and 5xx responses) are retried up to
+    max_retries times with exponential backoff, honouring Retry-After.
+    Successful responses are cached on disk (see OPENALEX_CACHE_EXPIRE_AFTER).
+    """
+    session = CachedSession(
+        OPENALEX_CACHE_NAME,
+        backend='sqlite',
+        expire_after=OPENALEX_CACHE_EXPIRE_AFTER,
+        allowable_codes=(200,),
+        allowable_methods=('GET',),
+    )
+    
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=1.5,  # Waits 0s, 3s, 6s, 12s, ... between attempts
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        raise_on_status=False  # Return the last response so it can be validated
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    session.verify = True  # Enable SSL verification
+    session.headers.update({
+        "Accept": "application/json",
+        "User-Agent": "SystematicReview/1.0",
+        "Accept-Encoding": ACCEPT_ENCODING,  # Includes br/zstd when their decoders are installed
+        "Connection": "keep-alive"
+    })
+    
+    # Add API key if available
+    if API_KEY:
+        session.headers["Authorization"] = f"Bearer {API_KEY}"
+    
+    return session
+
 def validate_openalex_response(response: requests.Response) -> Dict[str, Any]:
     """
     Validate and parse OpenAlex API response.
@@ -49,8 +123,8 @@ def validate_openalex_response(response: requests.Response) -> Dict[str, Any]:
         
         # Parse JSON
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise ResponseError(f"Invalid JSON response: {e}")
         
         # Validate response structure
@@ -85,111 +159,185 @@ def validate_openalex_response(response: requests.Response) -> Dict[str, Any]:
     except RequestException as e:
         raise ResponseError(f"Network error: {e}")
 
-def validate_openalex_paper_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+def _fetch_openalex_page(session: requests.Session, full_query: str, filters: List[str],
+                         cursor: str, timeout: int, limiter: RateLimiter) -> Dict[str, Any]:
     """
-    Validate and clean an OpenAlex paper entry from the API response.
+    Fetch and validate one page of OpenAlex results.
+    Transient failures are retried by the session's adapter (see create_session).
     
     Args:
-        entry: Raw paper entry from OpenAlex API
+        session: Session returned by create_session
+        full_query: Complete OpenAlex search text
+        filters: Structured OpenAlex filters (e.g. "from_publication_date:2010-01-01")
+        cursor: Pagination cursor, "*" for the first page
+        timeout: Request timeout in seconds
+        limiter: Rate limiter shared by all requests
         
     Returns:
-        Cleaned paper dictionary
+        Dict containing parsed JSON data
     """
-    if not isinstance(entry, dict):
-        logging.warning(f"Invalid entry type: {type(entry)}")
-        return {}
+    url = "https://api.openalex.org/works"
+    params = {
+        "search": full_query,
+        "cursor": cursor,
+        "per_page": OPENALEX_PAGE_SIZE,
+        "select": OPENALEX_SELECT_FIELDS
+    }
+    if filters:
+        params["filter"] = ",".join(filters)
+    if MAILTO:
+        params["mailto"] = MAILTO
     
-    # Extract and validate required fields
-    paper = {}
+    limiter.wait()
+    try:
+        response = session.get(url, params=params, timeout=timeout)
+    except RequestException as e:
+        # Only raised once the adapter has used up its retries
+        raise OpenAlexAPIError(f"Request failed: {e}")
+    limiter.update(response)
     
-    # DOI - can be None but should be string if present
-    doi = entry.get("doi")
-    if doi is not None and not isinstance(doi, str):
-        logging.warning(f"Invalid DOI type: {type(doi)}")
-        doi = None
-    paper["doi"] = doi
+    # Validate OpenAlex response
+    try:
+        data = validate_openalex_response(response)
+    except (RateLimitError, ResponseError) as e:
+        raise OpenAlexAPIError(f"API response error: {e}")
+    if cursor == "*":
+        logging.debug(f"Response Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+    return data
+
+def _join_openalex_authors(authorships: Any) -> Optional[str]:
+    """
+    Join the author display names of an OpenAlex ``authorships`` list.
+    """
+    if not authorships or not isinstance(authorships, list):
+        return None
+    author_names = []
+    for authorship in authorships:
+        author = authorship.get("author", {}) if isinstance(authorship, dict) else {}
+        display_name = author.get("display_name") if isinstance(author, dict) else None
+        if display_name:
+            author_names.append(display_name)
+    return "; ".join(author_names) if author_names else None
+
+def _openalex_source_name(primary_location: Any) -> Optional[str]:
+    """
+    Extract the source display name from an OpenAlex ``primary_location``.
+    """
+    source = primary_location.get("source") if isinstance(primary_location, dict) else None
+    display_name = source.get("display_name") if isinstance(source, dict) else None
+    return display_name if isinstance(display_name, str) else None
+
+def _extract_openalex_papers(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Validate and clean a page of OpenAlex works column-wise.
+    Produces the standard paper columns (doi, title, authors, year,
+    publicationName, url, citedby-count); missing or malformed values become
+    None (titles "Unknown Title"), and years outside 1900-2030 are dropped.
+    """
+    raw = pd.DataFrame.from_records([result for result in results if isinstance(result, dict)])
     
-    # Title - required field
-    title = entry.get("title")
-    if not title or not isinstance(title, str):
-        logging.warning(f"Missing or invalid title: {title}")
-        paper["title"] = "Unknown Title"
-    else:
-        paper["title"] = title.strip()
+    papers = pd.DataFrame(index=raw.index)
+    papers["doi"] = clean_text_column(frame_column(raw, "doi"))
+    papers["title"] = clean_text_column(frame_column(raw, "title")).fillna("Unknown Title")
+    papers["authors"] = frame_column(raw, "authorships").map(_join_openalex_authors)  # Nested list, still per row
+    # Year from the date string (e.g. "2010" or "2010-01-01")
+    papers["year"] = clean_year_column(frame_column(raw, "publication_date").astype(object).str.split("-", n=1).str[0])
+    papers["publicationName"] = clean_text_column(frame_column(raw, "primary_location").map(_openalex_source_name))
+    papers["url"] = clean_text_column(frame_column(raw, "id"))
+    cited_count = pd.to_numeric(frame_column(raw, "cited_by_count"), errors="coerce")
+    papers["citedby-count"] = cited_count.fillna(0).astype(int)
     
-    # Authors - extract from authorships array
-    authorships = entry.get("authorships", [])
-    if authorships and isinstance(authorships, list):
-        author_names = []
-        for authorship in authorships:
-            if isinstance(authorship, dict):
-                author = authorship.get("author", {})
-                if isinstance(author, dict):
-                    display_name = author.get("display_name")
-                    if display_name:
-                        author_names.append(display_name)
-        paper["authors"] = "; ".join(author_names) if author_names else None
-    else:
-        paper["authors"] = None
+    return papers
+
+def _walk_openalex_cursor(session: requests.Session, full_query: str, filters: List[str],
+                          timeout: int, limiter: RateLimiter, label: str = "",
+                          on_page: Optional[Callable[[pd.DataFrame], None]] = None) -> pd.DataFrame:
+    """
+    Fetch every page of an OpenAlex query by following meta.next_cursor.
     
-    # Year - validate and convert
-    publication_date = entry.get("publication_date")
-    if publication_date and isinstance(publication_date, str):
-        try:
-            # Extract year from date string (e.g., "2010" or "2010-01-01")
-            year = int(publication_date.split('-')[0])
-            if 1900 <= year <= 2030:  # Reasonable year range
-                paper["year"] = year
-            else:
-                logging.warning(f"Year out of reasonable range: {year}")
-                paper["year"] = None
-        except (ValueError, IndexError):
-            logging.warning(f"Invalid year format: {publication_date}")
-            paper["year"] = None
-    else:
-        paper["year"] = None
+    Unlike page numbers, cursors cost the server the same for every page and
+    are not capped at the first 10,000 results.
     
-    # Publication name - extract from primary_location
-    primary_location = entry.get("primary_location", {})
-    if isinstance(primary_location, dict):
-        source = primary_location.get("source", {})
-        if isinstance(source, dict):
-            display_name = source.get("display_name")
-            if display_name and isinstance(display_name, str):
-                paper["publicationName"] = display_name.strip()
-            else:
-                paper["publicationName"] = None
+    Args:
+        session: Session returned by create_session
+        full_query: Complete OpenAlex search text
+        filters: Structured OpenAlex filters
+        timeout: Request timeout in seconds
+        limiter: Rate limiter shared by all requests
+        label: Prefix identifying this walk in log messages
+        on_page: Called with each page's papers as it arrives; the pages
+            are then not kept, and an empty DataFrame is returned
+        
+    Returns:
+        DataFrame of validated papers
+    """
+    pages = []
+    paper_count = 0
+    cursor = "*"
+    batch = 1
+    while cursor:
+        logging.info(f"   {label}Fetching batch {batch}")
+        data = _fetch_openalex_page(session, full_query, filters, cursor, timeout, limiter)
+        
+        results = data.get('results', [])
+        if not results:
+            logging.info(f"{label}No more results found.")
+            break
+        
+        page_papers = _extract_openalex_papers(results)
+        if on_page is not None:
+            on_page(page_papers)
         else:
-            paper["publicationName"] = None
-    else:
-        paper["publicationName"] = None
-    
-    # URL - use OpenAlex URL
-    openalex_id = entry.get("id")
-    if openalex_id and isinstance(openalex_id, str):
-        paper["url"] = openalex_id
-    else:
-        paper["url"] = None
-    
-    # Citation count
-    cited_by_count = entry.get("cited_by_count")
-    if cited_by_count is not None:
-        try:
-            paper["citedby-count"] = int(cited_by_count)
-        except (ValueError, TypeError):
-            logging.warning(f"Invalid citation count: {cited_by_count}")
-            paper["citedby-count"] = 0
-    else:
-        paper["citedby-count"] = 0
+            pages.append(page_papers)
+        paper_count += len(page_papers)
+        
+        meta = data.get('meta', {})
+        total_count = meta.get('count', 0)
+        cursor = meta.get('next_cursor')
+        
+        logging.info(f"{label}Fetched {len(results)} papers, {len(page_papers)} valid. Total so far: {paper_count}. Total available: {total_count}")
+        batch += 1
     
-    return paper
+    pages = [page for page in pages if not page.empty]
+    return pd.concat(pages, ignore_index=True) if pages else _extract_openalex_papers([])
+
+def _output_identifier(query: str, venue_filter: Optional[str]) -> str:
+    """
+    Identifier used in the output file names of a search.
+    """
+    if venue_filter and _ISSN_RE.match(venue_filter):
+        # Use ISSN as identifier
+        return venue_filter
+    # Use first few words of query as identifier
+    words = query.split()[:3]
+    identifier = "_".join(words).lower()
+    return _NON_WORD_RE.sub('', identifier)[:20]  # Clean and limit length
+
+def _year_filters(start_year: Optional[int], end_year: Optional[int]) -> List[str]:
+    """
+    Build the publication-date filters of an OpenAlex query for a year range.
+    """
+    filters = []
+    if start_year:
+        filters.append(f"from_publication_date:{start_year}-01-01")
+    if end_year:
+        filters.append(f"to_publication_date:{end_year}-12-31")
+    return filters
 
 def get_openalex(query: str, venue_filter: Optional[str] = None, start_year: Optional[int] = None, 
                 end_year: Optional[int] = None, output_dir: str = 'output', timeout: int = 30, 
-                max_retries: int = 3, save_bibtex: bool = True) -> pd.DataFrame:
+                max_retries: int = 3, save_bibtex: bool = True, save_parquet: bool = True,
+                max_workers: int = 8, stream: bool = False) -> Optional[pd.DataFrame]:
     """
     Fetch papers from OpenAlex API for given query and optional filters.
     Returns a DataFrame of unique papers and saves to CSV and optionally BibTeX.
+    Results are paged with OpenAlex cursors, so deep pages stay cheap. When both
+    years are given, each year is walked as its own slice, concurrently.
+    With stream=True each page is appended to the output files as it arrives
+    and nothing is returned, so memory use doesn't grow with the result count;
+    the same papers are written, but in arrival order rather than year order.
+    Streaming is opt-in because callers that use the returned DataFrame
+    would otherwise get None.
     
     Parameters:
     - query: str, the search query
@@ -200,6 +348,9 @@ def get_openalex(query: str, venue_filter: Optional[str] = None, start_year: Opt
     - timeout: int, request timeout in seconds
     - max_retries: int, maximum number of retries for failed requests
     - save_bibtex: bool, whether to save BibTeX format output
+    - save_parquet: bool, whether to also save a Parquet copy of the CSV output
+    - max_workers: int, maximum number of year slices fetched concurrently
+    - stream: bool, write pages to disk as they arrive and return None
     
     Raises ValueError on invalid inputs.
     """
@@ -220,6 +371,12 @@ def get_openalex(query: str, venue_filter: Optional[str] = None, start_year: Opt
         raise ValueError("max_retries must be a non-negative integer.")
     if not isinstance(save_bibtex, bool):
         raise ValueError("save_bibtex must be a boolean.")
+    if not isinstance(save_parquet, bool):
+        raise ValueError("save_parquet must be a boolean.")
+    if not (isinstance(max_workers, int) and max_workers > 0):
+        raise ValueError("max_workers must be a positive integer.")
+    if not isinstance(stream, bool):
+        raise ValueError("stream must be a boolean.")
     
     # Clean inputs
     query = query.strip()
@@ -238,161 +395,99 @@ def get_openalex(query: str, venue_filter: Optional[str] = None, start_year: Opt
     except OSError as e:
         raise ValueError(f"Cannot create output directory: {e}")
     
-    all_papers = []  # Accumulate all papers in memory
-    
-    # Build query with filters
+    # Build query with filters. Structured filters are matched against the
+    # index server-side instead of going through full-text search.
     full_query = query
+    filters = []
     
     # Add venue filter if provided
     if venue_filter:
         # Check if it looks like an ISSN
-        if re.match(r'^\d{4}-\d{3}[\dX]$', venue_filter):
-            full_query += f" AND venue.issn:{venue_filter}"
+        if _ISSN_RE.match(venue_filter):
+            filters.append(f"primary_location.source.issn:{venue_filter}")
         else:
             # Treat as venue name
             full_query += f' AND venue.display_name:"{venue_filter}"'
     
-    # Add year filter if provided
+    logging.info(f"Processing query: {full_query}, filters: {','.join(filters + _year_filters(start_year, end_year))}")
+    
+    # Split a closed year range into one independent slice per year, each
+    # walked with its own cursor
     if start_year and end_year:
-        full_query += f" AND from_publication_date:{start_year}-01-01 AND to_publication_date:{end_year}-12-31"
-    elif start_year:
-        full_query += f" AND from_publication_date:{start_year}-01-01"
-    elif end_year:
-        full_query += f" AND to_publication_date:{end_year}-12-31"
+        year_slices = [(year, year) for year in range(start_year, end_year + 1)]
+    else:
+        year_slices = [(start_year, end_year)]
     
-    logging.info(f"Processing query: {full_query}")
+    # Output file names
+    identifier = _output_identifier(query, venue_filter)
+    cleaned_csv_filename = f'cleanedPapers_openalex_{identifier}.csv'
+    csv_path = os.path.join(output_folder, cleaned_csv_filename)
+    bibtex_filename = f'papers_openalex_{identifier}.bib'
+    bibtex_path = os.path.join(output_folder, bibtex_filename)
     
-    page = 1
-    batch = 1
-    consecutive_errors = 0
-    max_consecutive_errors = 3
+    # Pooled keep-alive session; paces requests and backs off when the quota is exhausted
+    session = create_session(max_retries)
+    limiter = RateLimiter(OPENALEX_REQUESTS_PER_SECOND, low_quota=OPENALEX_LOW_QUOTA,
+                          low_quota_wait=OPENALEX_LOW_QUOTA_WAIT)
     
-    while True:
-        logging.info(f"   Fetching batch {batch}, page: {page}")
-        url = "https://api.openalex.org/works"
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "SystematicReview/1.0"
-        }
-        
-        # Add API key if available
-        if API_KEY:
-            headers["Authorization"] = f"Bearer {API_KEY}"
-        
-        params = {
-            "search": full_query,
-            "page": page,
-            "per_page": 200,  # OpenAlex max per page
-            "select": "id,doi,title,authorships,publication_date,primary_location,cited_by_count"
-        }
-        
-        retries = max_retries
-        while retries >= 0:
+    papers_by_slice = {}
+    writer = None
+    on_page = None
+    if stream:
+        # The writer drops repeated DOIs itself and is safe to share
+        # between the concurrently walked slices
+        writer = PaperStreamWriter(csv_path, bibtex_path if save_bibtex else None,
+                                   csv_path.replace('.csv', '.parquet') if save_parquet else None)
+        on_page = writer.write
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for slice_start, slice_end in year_slices:
+                slice_filters = filters + _year_filters(slice_start, slice_end)
+                label = f"[{slice_start}] " if slice_start is not None and slice_start == slice_end else ""
+                future = executor.submit(_walk_openalex_cursor, session, full_query, slice_filters,
+                                         timeout, limiter, label, on_page)
+                futures[future] = (slice_start, slice_end)
             try:
-                response = requests.get(url, headers=headers, params=params, timeout=timeout)
-                
-                # Validate OpenAlex response
-                data = validate_openalex_response(response)
-                
-                # Check rate limit headers
-                remaining = response.headers.get('X-RateLimit-Remaining')
-                if remaining and int(remaining) < 10:
-                    logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                    time.sleep(10)
-                
-                results = data.get('results', [])
-                if not results:
-                    logging.info("No more results found.")
-                    break
-                
-                # Validate and extract papers
-                valid_papers = 0
-                for result in results:
-                    try:
-                        paper = validate_openalex_paper_entry(result)
-                        if paper:  # Only add if validation passed
-                            all_papers.append(paper)
-                            valid_papers += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to process paper entry: {e}")
-                        continue
-                
-                meta = data.get('meta', {})
-                total_count = meta.get('count', 0)
-                next_page = meta.get('next_cursor')
-                
-                logging.info(f"Fetched {len(results)} papers, {valid_papers} valid. Total so far: {len(all_papers)}. Total available: {total_count}")
-                
-                if not next_page:
-                    break
-                
-                page += 1
-                consecutive_errors = 0  # Reset error counter on success
-                time.sleep(1)  # Short sleep between pages
-                break  # Successful fetch, exit retry loop
-            
-            except RateLimitError as e:
-                logging.error(f"Rate limit exceeded: {e}")
-                time.sleep(60)  # Wait 1 minute before retry
-                retries -= 1
-                if retries < 0:
-                    raise OpenAlexAPIError(f"Rate limit exceeded: {e}")
-                    
-            except ResponseError as e:
-                logging.error(f"API response error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise OpenAlexAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise OpenAlexAPIError(f"API response error: {e}")
-                    
-            except (RequestException, Timeout) as e:
-                logging.error(f"Network error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise OpenAlexAPIError(f"Too many consecutive network errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise
-                    
-            except Exception as e:
-                logging.error(f"Unexpected error: {e}")
-                retries -= 1
-                if retries < 0:
-                    raise
-        
-        batch += 1
+                for future in as_completed(futures):
+                    papers_by_slice[futures[future]] = future.result()
+            except APIError:
+                # Don't wait for queued slices once one has failed for good
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    if writer is not None:
+        logging.info(f"Total unique papers found: {writer.paper_count}. Saved to {cleaned_csv_filename}")
+        if save_bibtex:
+            logging.info(f"BibTeX file saved to: {bibtex_filename}")
+        return None
     
-    if not all_papers:
+    # Reassemble slices in year order, dropping repeated DOIs in that order
+    # so the same copy is kept on every run
+    seen = set()  # DOIs of papers collected so far
+    slices = [drop_seen_papers(papers_by_slice[year_slice], seen) for year_slice in year_slices]
+    slices = [papers for papers in slices if not papers.empty]
+    if not slices:
         logging.info("No papers found.")
         return pd.DataFrame()
+    all_papers = pd.concat(slices, ignore_index=True)
     
     # Create DataFrame, de-dupe by DOI, save to CSV and BibTeX
     try:
-        # Generate identifier for filename
-        identifier = venue_filter if venue_filter else "general"
-        if venue_filter and re.match(r'^\d{4}-\d{3}[\dX]$', venue_filter):
-            # Use ISSN as identifier
-            identifier = venue_filter
-        else:
-            # Use first few words of query as identifier
-            words = query.split()[:3]
-            identifier = "_".join(words).lower()
-            identifier = re.sub(r'[^\w]', '', identifier)[:20]  # Clean and limit length
-        
         # Save to CSV
-        cleaned_csv_filename = f'cleanedPapers_openalex_{identifier}.csv'
-        csv_path = os.path.join(output_folder, cleaned_csv_filename)
         final_df = save_results_to_csv(all_papers, csv_path)
         
+        # Save a typed Parquet copy alongside the CSV
+        if save_parquet:
+            save_results_to_parquet(final_df, csv_path.replace('.csv', '.parquet'))
+        
         # Save to BibTeX if requested
         if save_bibtex:
-            bibtex_filename = f'papers_openalex_{identifier}.bib'
-            bibtex_path = os.path.join(output_folder, bibtex_filename)
-            save_bibtex(all_papers, bibtex_path)
+            write_bibtex(all_papers, bibtex_path)
         
         logging.info(f"Total unique papers found: {len(final_df)}. Saved to {cleaned_csv_filename}")
         if save_bibtex:
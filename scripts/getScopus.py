@@ -1,17 +1,21 @@
 import os
 import sys
-import json
+import orjson
 import requests
 import pandas as pd
 import time
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Dict, List, Optional, Any
-from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.exceptions import RequestException, Timeout
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from utils.api_utils import (
-    APIError, ResponseError, RateLimitError,
-    validate_api_response, validate_paper_entry,
-    save_bibtex, save_results_to_csv, make_api_request
+    APIError, ResponseError, RateLimitError, RateLimiter, retry_after_seconds,
+    save_bibtex as write_bibtex, save_results_to_csv,
+    records_to_frame, frame_column, clean_text_column, clean_year_column, drop_seen_papers
 )
 from dotenv import load_dotenv
 
@@ -26,6 +30,63 @@ class ScopusAPIError(APIError):
     """Custom exception for Scopus API related errors."""
     pass
 
+# Scopus Search endpoint
+SCOPUS_SEARCH_URL = "https://api.elsevier.com/content/search/scopus"
+
+# Scopus Search max records per request
+SCOPUS_PAGE_SIZE = 200
+
+# Scopus Search won't page past this many results of a single query
+SCOPUS_MAX_RESULTS = 5000
+
+# Overall request rate across all workers; Scopus Search allows 9 calls/s per key
+SCOPUS_REQUESTS_PER_SECOND = 9.0
+
+# Entry fields used for the paper columns; only these are requested, so
+# the server leaves the rest of each entry out of the response
+SCOPUS_FIELDS = ("prism:doi", "dc:title", "dc:creator", "prism:coverDisplayDate",
+                 "prism:publicationName", "prism:url", "citedby-count",
+                 "prism:issn", "prism:eIssn")
+
+# Query parameters shared by every page request; pages add query and start
+_SCOPUS_PAGE_PARAMS = {
+    "sort": "date",
+    "count": SCOPUS_PAGE_SIZE,
+    "field": ",".join(SCOPUS_FIELDS)
+}
+
+# Number of journals combined with OR into one Scopus query
+SCOPUS_MAX_ISSNS_PER_QUERY = 20
+
+# First four-digit run of a date string, taken as the publication year
+_YEAR_RE = re.compile(r'(\d{4})')
+
+def create_session() -> requests.Session:
+    """Create a pooled keep-alive session for Scopus requests."""
+    session = requests.Session()
+    
+    # 429 is left to the caller, which waits out the rate limit itself
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    session.headers.update({
+        'Accept': 'application/json',
+        'X-ELS-APIKey': API_KEY,
+        'Accept-Encoding': ACCEPT_ENCODING,  # Includes br/zstd when their decoders are installed
+        'Connection': 'keep-alive'
+    })
+    
+    return session
+
+# Shared by every page and every call so the TCP/TLS connection is reused
+_SCOPUS_SESSION = create_session()
+
 def validate_scopus_response(response: requests.Response) -> Dict[str, Any]:
     """
     Validate and parse Scopus API response.
@@ -40,44 +101,11 @@ def validate_scopus_response(response: requests.Response) -> Dict[str, Any]:
         ResponseError: If response is invalid
         RateLimitError: If rate limit is exceeded
     """
-    try:
-        # Check HTTP status code
-        response.raise_for_status()
-        
-        # Check content type
-        content_type = response.headers.get('content-type', '')
-        if 'application/json' not in content_type:
-            raise ResponseError(f"Expected JSON response, got: {content_type}")
-        
-        # Parse JSON
-        try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            raise ResponseError(f"Invalid JSON response: {e}")
-        
-        # Validate response structure
-        if not isinstance(data, dict):
-            raise ResponseError("Response is not a dictionary")
-        
-        # Check for error messages in Scopus response
-        if 'service-error' in data:
-            error_msg = data['service-error'].get('error', {}).get('error-message', 'Unknown error')
-            raise ResponseError(f"Scopus API Error: {error_msg}")
-        
-        # Check for search-results
-        if 'search-results' not in data:
-            raise ResponseError("Missing 'search-results' in response")
-        
-        search_results = data['search-results']
-        if not isinstance(search_results, dict):
-            raise ResponseError("'search-results' is not a dictionary")
-        
-        return data
-        
-    except HTTPError as e:
-        status_code = response.status_code
+    # Check HTTP status code directly instead of raising and catching HTTPError
+    status_code = response.status_code
+    if status_code >= 400:
         if status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
+            raise RateLimitError("Rate limit exceeded", retry_after=retry_after_seconds(response))
         elif status_code == 401:
             raise ResponseError("Authentication failed - check API key")
         elif status_code == 403:
@@ -85,117 +113,226 @@ def validate_scopus_response(response: requests.Response) -> Dict[str, Any]:
         elif status_code == 400:
             raise ResponseError("Bad request - check query parameters")
         else:
-            raise ResponseError(f"HTTP {status_code}: {e}")
-    except Timeout:
-        raise ResponseError("Request timed out")
-    except RequestException as e:
-        raise ResponseError(f"Network error: {e}")
+            raise ResponseError(f"HTTP {status_code}: {response.reason}")
+    
+    # Check content type
+    content_type = response.headers.get('content-type', '')
+    if 'application/json' not in content_type:
+        raise ResponseError(f"Expected JSON response, got: {content_type}")
+    
+    # Parse JSON
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise ResponseError(f"Invalid JSON response: {e}")
+    
+    # Validate response structure
+    if not isinstance(data, dict):
+        raise ResponseError("Response is not a dictionary")
+    
+    # Check for error messages in Scopus response
+    if 'service-error' in data:
+        error_msg = data['service-error'].get('error', {}).get('error-message', 'Unknown error')
+        raise ResponseError(f"Scopus API Error: {error_msg}")
+    
+    # Check for search-results
+    if 'search-results' not in data:
+        raise ResponseError("Missing 'search-results' in response")
+    
+    search_results = data['search-results']
+    if not isinstance(search_results, dict):
+        raise ResponseError("'search-results' is not a dictionary")
+    
+    return data
 
-def validate_scopus_paper_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+def _fetch_scopus_page(full_query: str, start_index: int, timeout: int, max_retries: int,
+                       limiter: RateLimiter) -> Dict[str, Any]:
     """
-    Validate and clean a Scopus paper entry from the API response.
+    Fetch and validate one page of Scopus results, retrying on errors.
     
     Args:
-        entry: Raw paper entry from Scopus API
+        full_query: Complete Scopus query text
+        start_index: 0-based offset of the first record of the page
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries
+        limiter: Rate limiter shared by all page workers
         
     Returns:
-        Cleaned paper dictionary
+        Dict containing parsed JSON data
     """
-    if not isinstance(entry, dict):
-        logging.warning(f"Invalid entry type: {type(entry)}")
-        return {}
-    
-    # Extract and validate required fields
-    paper = {}
-    
-    # DOI - can be None but should be string if present
-    doi = entry.get("prism:doi")
-    if doi is not None and not isinstance(doi, str):
-        logging.warning(f"Invalid DOI type: {type(doi)}")
-        doi = None
-    paper["doi"] = doi
-    
-    # Title - required field
-    title = entry.get("dc:title")
-    if not title or not isinstance(title, str):
-        logging.warning(f"Missing or invalid title: {title}")
-        paper["title"] = "Unknown Title"
-    else:
-        paper["title"] = title.strip()
-    
-    # Authors - can be None but should be string if present
-    authors = entry.get("dc:creator")
-    if authors is not None and not isinstance(authors, str):
-        logging.warning(f"Invalid authors type: {type(authors)}")
-        authors = None
-    paper["authors"] = authors
-    
-    # Year - validate and convert
-    year_str = entry.get("prism:coverDisplayDate")
-    if year_str and isinstance(year_str, str):
-        try:
-            # Extract year from date string (e.g., "2010" or "2010-01-01")
-            year = int(year_str.split('-')[0])
-            if 1900 <= year <= 2030:  # Reasonable year range
-                paper["year"] = year
-            else:
-                logging.warning(f"Year out of reasonable range: {year}")
-                paper["year"] = None
-        except (ValueError, IndexError):
-            logging.warning(f"Invalid year format: {year_str}")
-            paper["year"] = None
-    else:
-        paper["year"] = None
-    
-    # Publication name
-    pub_name = entry.get("prism:publicationName")
-    if pub_name and isinstance(pub_name, str):
-        paper["publicationName"] = pub_name.strip()
-    else:
-        paper["publicationName"] = None
-    
-    # URL
-    url = entry.get("prism:url")
-    if url and isinstance(url, str):
-        paper["url"] = url.strip()
-    else:
-        paper["url"] = None
-    
-    # Citation count
-    cited_count = entry.get("citedby-count")
-    if cited_count is not None:
+    params = {**_SCOPUS_PAGE_PARAMS, "query": full_query, "start": start_index}
+    
+    retries = max_retries
+    consecutive_errors = 0
+    max_consecutive_errors = 3
+    while True:
+        response = None
         try:
-            paper["citedby-count"] = int(cited_count)
-        except (ValueError, TypeError):
-            logging.warning(f"Invalid citation count: {cited_count}")
-            paper["citedby-count"] = 0
-    else:
-        paper["citedby-count"] = 0
-    
-    return paper
+            limiter.wait()
+            response = _SCOPUS_SESSION.get(SCOPUS_SEARCH_URL, params=params, timeout=timeout)
+            limiter.update(response)
+            
+            # Validate Scopus response
+            return validate_scopus_response(response)
+        
+        except RateLimitError as e:
+            retries -= 1
+            if retries < 0:
+                raise ScopusAPIError(f"Rate limit exceeded: {e}")
+            # Wait as long as the server asked, else back off exponentially
+            delay = e.retry_after if e.retry_after is not None else min(60, 2 ** (max_retries - retries))
+            logging.error(f"Rate limit exceeded: {e}. Retrying in {delay:.1f}s.")
+            limiter.pause(delay)  # Every worker waits, not just this one
+                
+        except ResponseError as e:
+            logging.error(f"API response error: {e}")
+            retries -= 1
+            consecutive_errors += 1
+            if consecutive_errors >= max_consecutive_errors:
+                raise ScopusAPIError(f"Too many consecutive errors ({consecutive_errors})")
+            if retries < 0:
+                raise ScopusAPIError(f"API response error: {e}")
+            # Honour Retry-After (e.g. on 503) before falling back to backoff
+            delay = retry_after_seconds(response) if response is not None else None
+            time.sleep(delay if delay is not None else 5 * (max_retries - retries))  # Exponential backoff
+                
+        except (RequestException, Timeout) as e:
+            logging.error(f"Network error: {e}")
+            retries -= 1
+            consecutive_errors += 1
+            if consecutive_errors >= max_consecutive_errors:
+                raise ScopusAPIError(f"Too many consecutive network errors ({consecutive_errors})")
+            time.sleep(5 * (max_retries - retries))  # Exponential backoff
+            if retries < 0:
+                raise ScopusAPIError(f"Network error: {e}")
 
+def _extract_scopus_papers(entries: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Validate and clean a page of Scopus entries column-wise.
+    Produces the standard paper columns (doi, title, authors, year,
+    publicationName, url, citedby-count) plus the journal's issn and eIssn;
+    missing or malformed values become None (titles "Unknown Title"), and
+    years outside 1900-2030 are dropped.
+    """
+    raw = records_to_frame(entries, SCOPUS_FIELDS)
+    
+    papers = pd.DataFrame(index=raw.index)
+    papers["doi"] = clean_text_column(frame_column(raw, "prism:doi"))
+    papers["title"] = clean_text_column(frame_column(raw, "dc:title")).fillna("Unknown Title")
+    papers["authors"] = clean_text_column(frame_column(raw, "dc:creator"))
+    # Year from the date string (e.g. "2010", "March 2010" or "1 March 2010")
+    papers["year"] = clean_year_column(frame_column(raw, "prism:coverDisplayDate").astype(object).str.extract(_YEAR_RE, expand=False))
+    papers["publicationName"] = clean_text_column(frame_column(raw, "prism:publicationName"))
+    papers["url"] = clean_text_column(frame_column(raw, "prism:url"))
+    cited_count = pd.to_numeric(frame_column(raw, "citedby-count"), errors="coerce")
+    papers["citedby-count"] = cited_count.fillna(0).astype("int32")
+    
+    # Journal identifiers, used to split multi-journal results
+    papers["issn"] = clean_text_column(frame_column(raw, "prism:issn"))
+    papers["eIssn"] = clean_text_column(frame_column(raw, "prism:eIssn"))
+    
+    return papers
 
+def _issn_key(issn: Optional[str]) -> Optional[str]:
+    """
+    Normalise an ISSN for comparison; Scopus returns them without the hyphen.
+    """
+    return issn.replace("-", "").upper() if isinstance(issn, str) else None
 
-def get_scopus(issn, query, start_year, end_year, output_dir='output', timeout=30, max_retries=3, save_bibtex=True):
+def _fetch_scopus_papers(base_query: str, start_year: int, end_year: int, timeout: int,
+                         max_retries: int, max_workers: int, limiter: RateLimiter) -> pd.DataFrame:
     """
-    Fetch papers from Scopus API for given ISSN, query, and year range.
-    Returns a DataFrame of unique papers and saves to CSV and optionally BibTeX.
+    Fetch every page of a Scopus query, one sub-query per publication year.
+    
+    One sub-query per year keeps each result set under the 5,000-result
+    paging limit and lets the years be fetched side by side.
+    
+    Args:
+        base_query: Scopus query text without the year clause
+        start_year: First publication year (inclusive)
+        end_year: Last publication year (exclusive)
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries per page
+        max_workers: Maximum number of concurrent page requests
+        limiter: Rate limiter shared by all page workers
+        
+    Returns:
+        DataFrame of unique papers in year/page order (empty if none)
+    """
+    papers_by_page = {}  # (year, start_index) -> DataFrame of papers
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}  # future -> (year, year_query, start_index)
+        for year in range(start_year, end_year):
+            year_query = f"{base_query} AND PUBYEAR IS {year}"
+            future = executor.submit(_fetch_scopus_page, year_query, 0, timeout, max_retries, limiter)
+            pending[future] = (year, year_query, 0)
+        
+        try:
+            # A year's first page tells us how many more pages to queue
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    year, year_query, start_index = pending.pop(future)
+                    data = future.result()
+                    entries = data['search-results'].get('entry', [])
+                    if start_index > 0:
+                        papers_by_page[(year, start_index)] = _extract_scopus_papers(entries)
+                        logging.info(f"Fetched {len(entries)} papers, {len(papers_by_page[(year, start_index)])} valid for year {year} at start_index {start_index}")
+                        continue
+                    
+                    # Queue the year's remaining pages before cleaning its
+                    # first one, so the requests are in flight meanwhile
+                    total_results = int(data['search-results'].get('opensearch:totalResults', 0))
+                    if total_results > SCOPUS_MAX_RESULTS:
+                        logging.warning(f"Year {year} has {total_results} results; only the first {SCOPUS_MAX_RESULTS} can be fetched.")
+                    if entries:
+                        for next_index in range(SCOPUS_PAGE_SIZE, min(total_results, SCOPUS_MAX_RESULTS), SCOPUS_PAGE_SIZE):
+                            future = executor.submit(_fetch_scopus_page, year_query, next_index, timeout, max_retries, limiter)
+                            pending[future] = (year, year_query, next_index)
+                    papers_by_page[(year, 0)] = _extract_scopus_papers(entries)
+                    logging.info(f"Fetched {len(entries)} papers, {len(papers_by_page[(year, 0)])} valid for year {year}. Total available: {total_results}")
+        except ScopusAPIError:
+            # Don't wait for queued pages once one has failed for good
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    
+    # Concatenate the per-page frames in year/page order, dropping repeated
+    # DOIs in that order so the same copy is kept on every run
+    seen = set()  # DOIs of papers collected so far
+    pages = [drop_seen_papers(papers_by_page[page_key], seen) for page_key in sorted(papers_by_page)]
+    pages = [papers for papers in pages if not papers.empty]
+    if not pages:
+        return _extract_scopus_papers([])
+    return pd.concat(pages, ignore_index=True)
+
+def get_scopus_multi(issns, query, start_year, end_year, output_dir='output', timeout=30, max_retries=3,
+                     save_bibtex=True, max_workers=5):
+    """
+    Fetch papers from Scopus API for several ISSNs, query, and year range.
+    Up to SCOPUS_MAX_ISSNS_PER_QUERY journals share one query (ISSN(a) OR
+    ISSN(b) ...), split into one sub-query per year; the results are then
+    split by journal. Returns a dict mapping each ISSN to its DataFrame of
+    unique papers and saves each to CSV and optionally BibTeX.
     
     Parameters:
-    - issn: str, journal ISSN
+    - issns: list of str, journal ISSNs
     - query: str, the search query for TITLE-ABS-KEY
-    - start_year: int, starting publication year (inclusive, uses AFT for after)
-    - end_year: int, ending publication year (exclusive, uses BEF for before)
+    - start_year: int, starting publication year (inclusive)
+    - end_year: int, ending publication year (exclusive)
     - output_dir: str, base directory for outputs
     - timeout: int, request timeout in seconds
     - max_retries: int, maximum number of retries for failed requests
     - save_bibtex: bool, whether to save BibTeX format output
+    - max_workers: int, maximum number of concurrent page requests
     
     Raises ValueError on invalid inputs.
     """
     # Input validation
-    if not isinstance(issn, str) or len(issn.strip()) == 0:
-        raise ValueError("ISSN must be a non-empty string.")
+    if not isinstance(issns, (list, tuple)) or len(issns) == 0:
+        raise ValueError("ISSNs must be a non-empty list of strings.")
+    if not all(isinstance(issn, str) and len(issn.strip()) > 0 for issn in issns):
+        raise ValueError("Each ISSN must be a non-empty string.")
     if not isinstance(query, str) or len(query.strip()) == 0:
         raise ValueError("Query must be a non-empty string.")
     if not (isinstance(start_year, int) and isinstance(end_year, int) and start_year < end_year):
@@ -206,144 +343,115 @@ def get_scopus(issn, query, start_year, end_year, output_dir='output', timeout=3
         raise ValueError("max_retries must be a non-negative integer.")
     if not isinstance(save_bibtex, bool):
         raise ValueError("save_bibtex must be a boolean.")
+    if not (isinstance(max_workers, int) and max_workers > 0):
+        raise ValueError("max_workers must be a positive integer.")
     
     # Clean inputs
-    issn = issn.strip()
+    issns = list(dict.fromkeys(issn.strip() for issn in issns))
     query = query.strip()
     
-    logging.info(f"Starting Scopus search for ISSN: {issn}, years: {start_year}-{end_year}, query: {query}")
+    logging.info(f"Starting Scopus search for ISSNs: {', '.join(issns)}, years: {start_year}-{end_year}, query: {query}")
     
-    # Prepare output folder
+    # Prepare output folders
+    output_folders = {}
     try:
-        output_folder = os.path.join(os.getcwd(), output_dir, issn)
-        os.makedirs(output_folder, exist_ok=True)
+        for issn in issns:
+            output_folders[issn] = os.path.join(os.getcwd(), output_dir, issn)
+            os.makedirs(output_folders[issn], exist_ok=True)
     except OSError as e:
         raise ValueError(f"Cannot create output directory: {e}")
     
-    all_papers = []  # Accumulate all papers in memory
+    # Shared by all page workers; fewer than 10 remaining requests slows
+    # every worker down by 10s per request, as the sequential loop did
+    limiter = RateLimiter(SCOPUS_REQUESTS_PER_SECOND, low_quota=9, low_quota_wait=10.0)
     
-    full_query = f"TITLE-ABS-KEY({query}) AND ISSN({issn}) AND (PUBYEAR AFT {start_year - 1} AND PUBYEAR BEF {end_year})"
-    logging.info(f"Processing query: {full_query}")
-    
-    start_index = 0
-    batch = 1
-    consecutive_errors = 0
-    max_consecutive_errors = 3
-    
-    while True:
-        logging.info(f"   Fetching batch {batch}, start_index: {start_index}")
-        url = "https://api.elsevier.com/content/search/scopus"
-        headers = {"Accept": "application/json", "X-ELS-APIKey": API_KEY}
-        params = {
-            "query": full_query,
-            "sort": "date",
-            "start": start_index,
-            "count": 200  # Larger page size for efficiency
-        }
+    papers_by_issn = {}
+    for group_start in range(0, len(issns), SCOPUS_MAX_ISSNS_PER_QUERY):
+        group = issns[group_start:group_start + SCOPUS_MAX_ISSNS_PER_QUERY]
+        issn_clause = " OR ".join(f"ISSN({issn})" for issn in group)
+        base_query = f"TITLE-ABS-KEY({query}) AND ({issn_clause})"
+        logging.info(f"Processing query: {base_query} AND (PUBYEAR AFT {start_year - 1} AND PUBYEAR BEF {end_year})")
         
-        retries = max_retries
-        while retries >= 0:
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=timeout)
-                
-                # Validate Scopus response
-                data = validate_scopus_response(response)
-                
-                # Check rate limit headers
-                remaining = response.headers.get('X-RateLimit-Remaining')
-                if remaining and int(remaining) < 10:
-                    logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                    time.sleep(10)
-                
-                entries = data.get('search-results', {}).get('entry', [])
-                if not entries:
-                    logging.info("No more entries found.")
-                    break
-                
-                # Validate and extract papers
-                valid_papers = 0
-                for entry in entries:
-                    try:
-                        paper = validate_scopus_paper_entry(entry)
-                        if paper:  # Only add if validation passed
-                            all_papers.append(paper)
-                            valid_papers += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to process paper entry: {e}")
-                        continue
-                
-                total_results = int(data['search-results'].get('opensearch:totalResults', 0))
-                start_index += params['count']
-                logging.info(f"Fetched {len(entries)} papers, {valid_papers} valid. Total so far: {len(all_papers)}. Next start: {start_index}/{total_results}")
-                
-                if start_index >= total_results:
-                    break
-                
-                consecutive_errors = 0  # Reset error counter on success
-                time.sleep(1)  # Short sleep between pages
-                break  # Successful fetch, exit retry loop
-            
-            except RateLimitError as e:
-                logging.error(f"Rate limit exceeded: {e}")
-                time.sleep(60)  # Wait 1 minute before retry
-                retries -= 1
-                if retries < 0:
-                    raise ScopusAPIError(f"Rate limit exceeded: {e}")
-                    
-            except ResponseError as e:
-                logging.error(f"API response error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise ScopusAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise ScopusAPIError(f"API response error: {e}")
-                    
-            except (RequestException, Timeout) as e:
-                logging.error(f"Network error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise ScopusAPIError(f"Too many consecutive network errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise
-                    
-            except Exception as e:
-                logging.error(f"Unexpected error: {e}")
-                retries -= 1
-                if retries < 0:
-                    raise
+        papers = _fetch_scopus_papers(base_query, start_year, end_year, timeout, max_retries, max_workers, limiter)
         
-        batch += 1
-    
-    if not all_papers:
-        logging.info("No papers found.")
-        return pd.DataFrame()
-    
-    # Create DataFrame, de-dupe by DOI, save to CSV and BibTeX
-    try:
-        # Save to CSV
-        cleaned_csv_filename = f'cleanedPapers_{issn}.csv'
-        csv_path = os.path.join(output_folder, cleaned_csv_filename)
-        final_df = save_results_to_csv(all_papers, csv_path)
+        if len(group) == 1:
+            # Nothing to split; keep papers whose ISSN fields are missing
+            papers_by_issn[group[0]] = papers.drop(columns=["issn", "eIssn"])
+            continue
         
-        # Save to BibTeX if requested
-        if save_bibtex:
-            bibtex_filename = f'papers_{issn}.bib'
-            bibtex_path = os.path.join(output_folder, bibtex_filename)
-            save_bibtex(all_papers, bibtex_path)
-        
-        logging.info(f"Total unique papers found: {len(final_df)}. Saved to {cleaned_csv_filename}")
-        if save_bibtex:
-            logging.info(f"BibTeX file saved to: {bibtex_filename}")
+        # Assign each paper to the first requested journal it matches
+        issn_keys = papers["issn"].map(_issn_key)
+        eissn_keys = papers["eIssn"].map(_issn_key)
+        unassigned = pd.Series(True, index=papers.index)
+        for issn in group:
+            key = _issn_key(issn)
+            matches = unassigned & ((issn_keys == key) | (eissn_keys == key))
+            papers_by_issn[issn] = papers[matches].drop(columns=["issn", "eIssn"]).reset_index(drop=True)
+            unassigned &= ~matches
+        if unassigned.any():
+            logging.warning(f"{int(unassigned.sum())} papers matched none of the requested ISSNs and were dropped.")
+    
+    results = {}
+    for issn in issns:
+        all_papers = papers_by_issn[issn]
+        if all_papers.empty:
+            logging.info(f"No papers found for ISSN {issn}.")
+            results[issn] = pd.DataFrame()
+            continue
         
-        return final_df
+        output_folder = output_folders[issn]
         
-    except Exception as e:
-        logging.error(f"Error processing results: {e}")
-        raise ScopusAPIError(f"Failed to process results: {e}")
+        # Create DataFrame, de-dupe by DOI, save to CSV and BibTeX
+        try:
+            # Save to CSV
+            cleaned_csv_filename = f'cleanedPapers_{issn}.csv'
+            csv_path = os.path.join(output_folder, cleaned_csv_filename)
+            final_df = save_results_to_csv(all_papers, csv_path)
+            
+            # Save to BibTeX if requested
+            if save_bibtex:
+                bibtex_filename = f'papers_{issn}.bib'
+                bibtex_path = os.path.join(output_folder, bibtex_filename)
+                write_bibtex(all_papers, bibtex_path)
+            
+            logging.info(f"Total unique papers found for ISSN {issn}: {len(final_df)}. Saved to {cleaned_csv_filename}")
+            if save_bibtex:
+                logging.info(f"BibTeX file saved to: {bibtex_filename}")
+            
+            results[issn] = final_df
+            
+        except Exception as e:
+            logging.error(f"Error processing results: {e}")
+            raise ScopusAPIError(f"Failed to process results: {e}")
+    
+    return results
+
+def get_scopus(issn, query, start_year, end_year, output_dir='output', timeout=30, max_retries=3, save_bibtex=True,
+               max_workers=5):
+    """
+    Fetch papers from Scopus API for given ISSN, query, and year range.
+    Returns a DataFrame of unique papers and saves to CSV and optionally BibTeX.
+    Single-journal form of get_scopus_multi.
+    
+    Parameters:
+    - issn: str, journal ISSN
+    - query: str, the search query for TITLE-ABS-KEY
+    - start_year: int, starting publication year (inclusive, uses AFT for after)
+    - end_year: int, ending publication year (exclusive, uses BEF for before)
+    - output_dir: str, base directory for outputs
+    - timeout: int, request timeout in seconds
+    - max_retries: int, maximum number of retries for failed requests
+    - save_bibtex: bool, whether to save BibTeX format output
+    - max_workers: int, maximum number of concurrent page requests
+    
+    Raises ValueError on invalid inputs.
+    """
+    if not isinstance(issn, str) or len(issn.strip()) == 0:
+        raise ValueError("ISSN must be a non-empty string.")
+    
+    results = get_scopus_multi([issn], query, start_year, end_year, output_dir=output_dir, timeout=timeout,
+                               max_retries=max_retries, save_bibtex=save_bibtex, max_workers=max_workers)
+    return results[issn.strip()]
 
 if __name__ == "__main__":
     # Example usage
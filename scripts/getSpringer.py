@@ -1,17 +1,21 @@
 import os
 import sys
-import json
+import orjson
 import requests
 import pandas as pd
 import time
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
-from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.exceptions import RequestException, Timeout
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from utils.api_utils import (
-    APIError, ResponseError, RateLimitError,
-    validate_api_response, validate_paper_entry,
-    save_bibtex, save_results_to_csv, make_api_request
+    APIError, ResponseError, RateLimitError, RateLimiter, retry_after_seconds,
+    save_bibtex as write_bibtex, save_results_to_csv,
+    records_to_frame, frame_column, clean_text_column, clean_year_column, drop_seen_papers
 )
 from dotenv import load_dotenv
 
@@ -26,6 +30,55 @@ class SpringerAPIError(APIError):
     """Custom exception for Springer API related errors."""
     pass
 
+# Springer Metadata API endpoint
+SPRINGER_RECORDS_URL = "https://api.springernature.com/metadata/v2/records"
+
+# Springer's default page size
+SPRINGER_PAGE_SIZE = 100
+
+# Overall request rate across all workers
+SPRINGER_REQUESTS_PER_SECOND = 5.0
+
+# Entry fields used for the paper columns; the rest of each entry is ignored
+SPRINGER_FIELDS = ("doi", "title", "creators", "publicationDate", "publicationName", "url")
+
+# Query parameters shared by every page request; pages add q and start.
+# The API key is sent by the session.
+_SPRINGER_PAGE_PARAMS = {
+    "count": SPRINGER_PAGE_SIZE,
+    "sort": "date"
+}
+
+# First four-digit run of a date string, taken as the publication year
+_YEAR_RE = re.compile(r'(\d{4})')
+
+def create_session() -> requests.Session:
+    """Create a pooled keep-alive session for Springer requests."""
+    session = requests.Session()
+    
+    # 429 is left to the caller, which waits out the rate limit itself
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    # Springer takes the key as a query parameter on every request
+    session.params = {"api_key": API_KEY}
+    session.headers.update({
+        'Accept': 'application/json',
+        'Accept-Encoding': ACCEPT_ENCODING,  # Includes br/zstd when their decoders are installed
+        'Connection': 'keep-alive'
+    })
+    
+    return session
+
+# Shared by every page and every call so the TCP/TLS connection is reused
+_SPRINGER_SESSION = create_session()
+
 def validate_springer_response(response: requests.Response) -> Dict[str, Any]:
     """
     Validate and parse Springer API response.
@@ -40,44 +93,11 @@ def validate_springer_response(response: requests.Response) -> Dict[str, Any]:
         ResponseError: If response is invalid
         RateLimitError: If rate limit is exceeded
     """
-    try:
-        # Check HTTP status code
-        response.raise_for_status()
-        
-        # Check content type
-        content_type = response.headers.get('content-type', '')
-        if 'application/json' not in content_type:
-            raise ResponseError(f"Expected JSON response, got: {content_type}")
-        
-        # Parse JSON
-        try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            raise ResponseError(f"Invalid JSON response: {e}")
-        
-        # Validate response structure
-        if not isinstance(data, dict):
-            raise ResponseError("Response is not a dictionary")
-        
-        # Check for error messages in Springer response
-        if 'error' in data:
-            error_msg = data['error'].get('message', 'Unknown error')
-            raise ResponseError(f"Springer API Error: {error_msg}")
-        
-        # Check for records
-        if 'records' not in data:
-            raise ResponseError("Missing 'records' in response")
-        
-        records = data['records']
-        if not isinstance(records, list):
-            raise ResponseError("'records' is not a list")
-        
-        return data
-        
-    except HTTPError as e:
-        status_code = response.status_code
+    # Check HTTP status code directly instead of raising and catching HTTPError
+    status_code = response.status_code
+    if status_code >= 400:
         if status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
+            raise RateLimitError("Rate limit exceeded", retry_after=retry_after_seconds(response))
         elif status_code == 401:
             raise ResponseError("Authentication failed - check API key")
         elif status_code == 403:
@@ -85,101 +105,162 @@ def validate_springer_response(response: requests.Response) -> Dict[str, Any]:
         elif status_code == 400:
             raise ResponseError("Bad request - check query parameters")
         else:
-            raise ResponseError(f"HTTP {status_code}: {e}")
-    except Timeout:
-        raise ResponseError("Request timed out")
-    except RequestException as e:
-        raise ResponseError(f"Network error: {e}")
+            raise ResponseError(f"HTTP {status_code}: {response.reason}")
+    
+    # Check content type
+    content_type = response.headers.get('content-type', '')
+    if 'application/json' not in content_type:
+        raise ResponseError(f"Expected JSON response, got: {content_type}")
+    
+    # Parse JSON
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise ResponseError(f"Invalid JSON response: {e}")
+    
+    # Validate response structure
+    if not isinstance(data, dict):
+        raise ResponseError("Response is not a dictionary")
+    
+    # Check for error messages in Springer response
+    if 'error' in data:
+        error_msg = data['error'].get('message', 'Unknown error')
+        raise ResponseError(f"Springer API Error: {error_msg}")
+    
+    # Check for records
+    if 'records' not in data:
+        raise ResponseError("Missing 'records' in response")
+    
+    records = data['records']
+    if not isinstance(records, list):
+        raise ResponseError("'records' is not a list")
+    
+    return data
 
-def validate_springer_paper_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+def _fetch_springer_page(full_query: str, date_range: Optional[str], start_index: int, timeout: int,
+                         max_retries: int, limiter: RateLimiter) -> Dict[str, Any]:
     """
-    Validate and clean a Springer paper entry from the API response.
+    Fetch and validate one page of Springer results, retrying on errors.
     
     Args:
-        entry: Raw paper entry from Springer API
+        full_query: Complete Springer query text
+        date_range: Publication date range ("2010-2023"), or None for all dates
+        start_index: Offset of the first record of the page
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries
+        limiter: Rate limiter shared by all page workers
         
     Returns:
-        Cleaned paper dictionary
+        Dict containing parsed JSON data
     """
-    if not isinstance(entry, dict):
-        logging.warning(f"Invalid entry type: {type(entry)}")
-        return {}
-    
-    # Extract and validate required fields
-    paper = {}
+    params = {**_SPRINGER_PAGE_PARAMS, "q": full_query, "start": start_index}
     
-    # DOI - can be None but should be string if present
-    doi = entry.get("doi")
-    if doi is not None and not isinstance(doi, str):
-        logging.warning(f"Invalid DOI type: {type(doi)}")
-        doi = None
-    paper["doi"] = doi
+    # Add date range filter if specified
+    if date_range:
+        params["date"] = date_range
     
-    # Title - required field
-    title = entry.get("title")
-    if not title or not isinstance(title, str):
-        logging.warning(f"Missing or invalid title: {title}")
-        paper["title"] = "Unknown Title"
-    else:
-        paper["title"] = title.strip()
-    
-    # Authors - can be None but should be string if present
-    authors = entry.get("creators")
-    if authors is not None:
-        if isinstance(authors, list):
-            # Join multiple authors with semicolon
-            author_names = []
-            for author in authors:
-                if isinstance(author, dict) and 'creator' in author:
-                    author_name = author['creator']
-                    if isinstance(author_name, str):
-                        author_names.append(author_name.strip())
-            authors = '; '.join(author_names) if author_names else None
-        elif not isinstance(authors, str):
-            logging.warning(f"Invalid authors type: {type(authors)}")
-            authors = None
-    paper["authors"] = authors
-    
-    # Year - validate and convert
-    year_str = entry.get("publicationDate")
-    if year_str and isinstance(year_str, str):
+    retries = max_retries
+    consecutive_errors = 0
+    max_consecutive_errors = 3
+    while True:
+        response = None
         try:
-            # Extract year from date string (e.g., "2010" or "2010-01-01")
-            year = int(year_str.split('-')[0])
-            if 1900 <= year <= 2030:  # Reasonable year range
-                paper["year"] = year
-            else:
-                logging.warning(f"Year out of reasonable range: {year}")
-                paper["year"] = None
-        except (ValueError, IndexError):
-            logging.warning(f"Invalid year format: {year_str}")
-            paper["year"] = None
-    else:
-        paper["year"] = None
-    
-    # Publication name
-    pub_name = entry.get("publicationName")
-    if pub_name and isinstance(pub_name, str):
-        paper["publicationName"] = pub_name.strip()
-    else:
-        paper["publicationName"] = None
-    
-    # URL
-    url = entry.get("url")
-    if url and isinstance(url, str):
-        paper["url"] = url.strip()
-    else:
-        paper["url"] = None
+            limiter.wait()
+            response = _SPRINGER_SESSION.get(SPRINGER_RECORDS_URL, params=params, timeout=timeout)
+            limiter.update(response)
+            
+            # Validate Springer response
+            return validate_springer_response(response)
+        
+        except RateLimitError as e:
+            retries -= 1
+            if retries < 0:
+                raise SpringerAPIError(f"Rate limit exceeded: {e}")
+            # Wait as long as the server asked, else back off exponentially
+            delay = e.retry_after if e.retry_after is not None else min(60, 2 ** (max_retries - retries))
+            logging.error(f"Rate limit exceeded: {e}. Retrying in {delay:.1f}s.")
+            limiter.pause(delay)  # Every worker waits, not just this one
+                
+        except ResponseError as e:
+            logging.error(f"API response error: {e}")
+            retries -= 1
+            consecutive_errors += 1
+            if consecutive_errors >= max_consecutive_errors:
+                raise SpringerAPIError(f"Too many consecutive errors ({consecutive_errors})")
+            if retries < 0:
+                raise SpringerAPIError(f"API response error: {e}")
+            # Honour Retry-After (e.g. on 503) before falling back to backoff
+            delay = retry_after_seconds(response) if response is not None else None
+            time.sleep(delay if delay is not None else 5 * (max_retries - retries))  # Exponential backoff
+                
+        except (RequestException, Timeout) as e:
+            logging.error(f"Network error: {e}")
+            retries -= 1
+            consecutive_errors += 1
+            if consecutive_errors >= max_consecutive_errors:
+                raise SpringerAPIError(f"Too many consecutive network errors ({consecutive_errors})")
+            time.sleep(5 * (max_retries - retries))  # Exponential backoff
+            if retries < 0:
+                raise SpringerAPIError(f"Network error: {e}")
+
+def _springer_total(data: Dict[str, Any]) -> int:
+    """
+    Read the total number of matching records from a Springer response.
+    The v2 API wraps the summary in a one-element ``result`` list.
+    """
+    result = data.get('result', {})
+    if isinstance(result, list):
+        result = result[0] if result and isinstance(result[0], dict) else {}
+    try:
+        return int(result.get('total', 0))
+    except (TypeError, ValueError):
+        return 0
+
+def _join_springer_authors(creators: Any) -> Optional[str]:
+    """
+    Join the names of a Springer ``creators`` list with semicolons.
+    Well-formed lists take a straight-line path; anything else falls back
+    to checking every entry.
+    """
+    try:
+        author_names = [creator['creator'].strip() for creator in creators]
+    except (KeyError, TypeError, AttributeError):
+        if isinstance(creators, str):
+            return creators
+        if not isinstance(creators, list):
+            return None
+        author_names = [creator['creator'].strip() for creator in creators
+                        if isinstance(creator, dict) and isinstance(creator.get('creator'), str)]
+    return '; '.join(author_names) if author_names else None
+
+def _extract_springer_papers(entries: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Validate and clean a page of Springer records column-wise.
+    Produces the standard paper columns (doi, title, authors, year,
+    publicationName, url, citedby-count); missing or malformed values become
+    None (titles "Unknown Title"), and years outside 1900-2030 are dropped.
+    """
+    raw = records_to_frame(entries, SPRINGER_FIELDS)
     
-    # Citation count - Springer doesn't provide this directly
-    paper["citedby-count"] = 0
+    papers = pd.DataFrame(index=raw.index)
+    papers["doi"] = clean_text_column(frame_column(raw, "doi"))
+    papers["title"] = clean_text_column(frame_column(raw, "title")).fillna("Unknown Title")
+    papers["authors"] = frame_column(raw, "creators").map(_join_springer_authors)  # Nested list, still per row
+    # Year from the date string (e.g. "2010" or "2010-01-01")
+    papers["year"] = clean_year_column(frame_column(raw, "publicationDate").astype(object).str.extract(_YEAR_RE, expand=False))
+    papers["publicationName"] = clean_text_column(frame_column(raw, "publicationName"))
+    papers["url"] = clean_text_column(frame_column(raw, "url"))
+    # Springer doesn't provide citation counts
+    papers["citedby-count"] = pd.Series(0, index=raw.index, dtype="int32")
     
-    return paper
+    return papers
 
-def get_springer(issn, query, start_year, end_year, output_dir='output', timeout=30, max_retries=3, save_bibtex=True):
+def get_springer(issn, query, start_year, end_year, output_dir='output', timeout=30, max_retries=3, save_bibtex=True,
+                 max_workers=10):
     """
     Fetch papers from Springer API for given ISSN, query, and year range.
     Returns a DataFrame of unique papers and saves to CSV and optionally BibTeX.
+    The first page is fetched alone; the remaining pages are fetched concurrently.
     
     Parameters:
     - issn: str, journal ISSN
@@ -190,6 +271,7 @@ def get_springer(issn, query, start_year, end_year, output_dir='output', timeout
     - timeout: int, request timeout in seconds
     - max_retries: int, maximum number of retries for failed requests
     - save_bibtex: bool, whether to save BibTeX format output
+    - max_workers: int, maximum number of concurrent page requests
     
     Raises ValueError on invalid inputs.
     """
@@ -206,6 +288,8 @@ def get_springer(issn, query, start_year, end_year, output_dir='output', timeout
         raise ValueError("max_retries must be a non-negative integer.")
     if not isinstance(save_bibtex, bool):
         raise ValueError("save_bibtex must be a boolean.")
+    if not (isinstance(max_workers, int) and max_workers > 0):
+        raise ValueError("max_workers must be a positive integer.")
     
     # Clean inputs
     issn = issn.strip()
@@ -220,114 +304,57 @@ def get_springer(issn, query, start_year, end_year, output_dir='output', timeout
     except OSError as e:
         raise ValueError(f"Cannot create output directory: {e}")
     
-    all_papers = []  # Accumulate all papers in memory
-    
     # Build query for Springer API
     # Springer uses different query format than Scopus
     full_query = f"issn:{issn} AND ({query})"
+    date_range = f"{start_year}-{end_year-1}" if start_year and end_year else None
     logging.info(f"Processing query: {full_query}")
     
-    start_index = 0
-    batch = 1
-    consecutive_errors = 0
-    max_consecutive_errors = 3
+    # Shared by all page workers; fewer than 10 remaining requests slows
+    # every worker down by 10s per request, as the sequential loop did
+    limiter = RateLimiter(SPRINGER_REQUESTS_PER_SECOND, low_quota=9, low_quota_wait=10.0)
     
-    while True:
-        logging.info(f"   Fetching batch {batch}, start_index: {start_index}")
-        url = "https://api.springernature.com/metadata/v2/records"
-        headers = {"Accept": "application/json"}
-        params = {
-            "q": full_query,
-            "api_key": API_KEY,
-            "start": start_index,
-            "count": 100,  # Springer's default page size
-            "sort": "date"
-        }
-        
-        # Add date range filter if specified
-        if start_year and end_year:
-            params["date"] = f"{start_year}-{end_year-1}"
-        
-        retries = max_retries
-        while retries >= 0:
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=timeout)
-                
-                # Validate Springer response
-                data = validate_springer_response(response)
-                
-                # Check rate limit headers (Springer may not provide these)
-                remaining = response.headers.get('X-RateLimit-Remaining')
-                if remaining and int(remaining) < 10:
-                    logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                    time.sleep(10)
-                
-                entries = data.get('records', [])
-                if not entries:
-                    logging.info("No more entries found.")
-                    break
-                
-                # Validate and extract papers
-                valid_papers = 0
-                for entry in entries:
-                    try:
-                        paper = validate_springer_paper_entry(entry)
-                        if paper:  # Only add if validation passed
-                            all_papers.append(paper)
-                            valid_papers += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to process paper entry: {e}")
-                        continue
-                
-                total_results = int(data.get('result', {}).get('total', 0))
-                start_index += params['count']
-                logging.info(f"Fetched {len(entries)} papers, {valid_papers} valid. Total so far: {len(all_papers)}. Next start: {start_index}/{total_results}")
-                
-                if start_index >= total_results:
-                    break
-                
-                consecutive_errors = 0  # Reset error counter on success
-                time.sleep(1)  # Short sleep between pages
-                break  # Successful fetch, exit retry loop
+    # The first page tells us how many pages there are
+    logging.info("   Fetching batch 1, start_index: 0")
+    data = _fetch_springer_page(full_query, date_range, 0, timeout, max_retries, limiter)
+    entries = data.get('records', [])
+    total_results = _springer_total(data)
+    papers_by_start = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Queue the remaining pages before cleaning the first one, so the
+        # requests are already in flight while it is processed
+        futures = {}
+        if entries:
+            futures = {
+                executor.submit(_fetch_springer_page, full_query, date_range, start_index, timeout, max_retries, limiter): start_index
+                for start_index in range(SPRINGER_PAGE_SIZE, total_results, SPRINGER_PAGE_SIZE)
+            }
+        try:
+            papers_by_start[0] = _extract_springer_papers(entries)
+            logging.info(f"Fetched {len(entries)} papers, {len(papers_by_start[0])} valid. Total available: {total_results}")
+            if not entries:
+                logging.info("No more entries found.")
             
-            except RateLimitError as e:
-                logging.error(f"Rate limit exceeded: {e}")
-                time.sleep(60)  # Wait 1 minute before retry
-                retries -= 1
-                if retries < 0:
-                    raise SpringerAPIError(f"Rate limit exceeded: {e}")
-                    
-            except ResponseError as e:
-                logging.error(f"API response error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise SpringerAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise SpringerAPIError(f"API response error: {e}")
-                    
-            except (RequestException, Timeout) as e:
-                logging.error(f"Network error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise SpringerAPIError(f"Too many consecutive network errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise
-                    
-            except Exception as e:
-                logging.error(f"Unexpected error: {e}")
-                retries -= 1
-                if retries < 0:
-                    raise
-        
-        batch += 1
+            for future in as_completed(futures):
+                start_index = futures[future]
+                entries = future.result().get('records', [])
+                papers_by_start[start_index] = _extract_springer_papers(entries)
+                logging.info(f"Fetched {len(entries)} papers, {len(papers_by_start[start_index])} valid at start_index {start_index}/{total_results}")
+        except SpringerAPIError:
+            # Don't wait for queued pages once one has failed for good
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
     
-    if not all_papers:
+    # Concatenate the per-page frames in the order the API returned them,
+    # dropping repeated DOIs in that order so the same copy is kept every run
+    seen = set()  # DOIs of papers collected so far
+    pages = [drop_seen_papers(papers_by_start[start_index], seen) for start_index in sorted(papers_by_start)]
+    pages = [papers for papers in pages if not papers.empty]
+    if not pages:
         logging.info("No papers found.")
         return pd.DataFrame()
+    all_papers = pd.concat(pages, ignore_index=True)
     
     # Create DataFrame, de-dupe by DOI, save to CSV and BibTeX
     try:
@@ -340,7 +367,7 @@ def get_springer(issn, query, start_year, end_year, output_dir='output', timeout
         if save_bibtex:
             bibtex_filename = f'papers_{issn}.bib'
             bibtex_path = os.path.join(output_folder, bibtex_filename)
-            save_bibtex(all_papers, bibtex_path)
+            write_bibtex(all_papers, bibtex_path)
         
         logging.info(f"Total unique papers found: {len(final_df)}. Saved to {cleaned_csv_filename}")
         if save_bibtex:
@@ -3,14 +3,13 @@ import sys
 import json
 import requests
 import pandas as pd
-import time
 import logging
 from typing import Dict, List, Optional, Any
 from requests.exceptions import RequestException, Timeout, HTTPError
 from utils.api_utils import (
-    APIError, ResponseError, RateLimitError,
+    APIError, ResponseError, RateLimitError, RateLimiter,
     validate_api_response, validate_paper_entry,
-    save_bibtex, save_results_to_csv, make_api_request
+    save_bibtex as write_bibtex, save_results_to_csv, make_api_request, make_api_requests_bulk
 )
 from dotenv import load_dotenv
 
@@ -25,6 +24,12 @@ class WebOfScienceAPIError(APIError):
     """Custom exception for Web of Science API related errors."""
     pass
 
+# Web of Science max records per request
+WOS_PAGE_SIZE = 50
+
+# Overall request rate across all page workers
+WOS_REQUESTS_PER_SECOND = 2.0
+
 def validate_wos_response(response: requests.Response) -> Dict[str, Any]:
     """
     Validate and parse Web of Science API response.
@@ -187,11 +192,56 @@ def validate_wos_paper_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     
     return paper
 
+def _fetch_wos_page(url: str, headers: Dict[str, str], params: Dict[str, Any],
+                    timeout: int, max_retries: int, limiter: RateLimiter) -> Dict[str, Any]:
+    """
+    Fetch and validate one page of Web of Science results.
+    
+    Retries happen inside make_api_request, paced by the shared limiter;
+    only its final failure is raised here.
+    
+    Args:
+        url: API endpoint URL
+        headers: Request headers
+        params: Query parameters, including firstRecord
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries
+        limiter: Rate limiter shared by all page requests
+        
+    Returns:
+        Dict containing parsed JSON data
+    """
+    try:
+        response = make_api_request(url, headers, params, timeout, max_retries, limiter=limiter)
+        
+        # Validate Web of Science specific response
+        return validate_wos_response(response)
+    
+    except (APIError, RequestException) as e:
+        raise WebOfScienceAPIError(f"Failed to fetch results at record {params['firstRecord']}: {e}")
+
+def _extract_wos_papers(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Validate a page of Web of Science records, skipping the ones that fail.
+    """
+    papers = []
+    for record in records:
+        try:
+            paper = validate_wos_paper_entry(record)
+            if paper:  # Only add if validation passed
+                papers.append(paper)
+        except Exception as e:
+            logging.warning(f"Failed to process record entry: {e}")
+            continue
+    return papers
+
 def get_web_of_science(query: str, start_year: int, end_year: int, output_dir: str = 'output', 
-                       timeout: int = 30, max_retries: int = 3, save_bibtex: bool = True) -> pd.DataFrame:
+                       timeout: int = 30, max_retries: int = 3, save_bibtex: bool = True,
+                       max_workers: int = 4) -> pd.DataFrame:
     """
     Fetch papers from Web of Science API for given query and year range.
     Returns a DataFrame of unique papers and saves to CSV and optionally BibTeX.
+    The first page is fetched alone; the remaining pages are fetched concurrently.
     
     Parameters:
     - query: str, the search query
@@ -201,6 +251,7 @@ def get_web_of_science(query: str, start_year: int, end_year: int, output_dir: s
     - timeout: int, request timeout in seconds
     - max_retries: int, maximum number of retries for failed requests
     - save_bibtex: bool, whether to save BibTeX format output
+    - max_workers: int, maximum number of concurrent page requests
     
     Raises ValueError on invalid inputs.
     """
@@ -215,6 +266,8 @@ def get_web_of_science(query: str, start_year: int, end_year: int, output_dir: s
         raise ValueError("max_retries must be a non-negative integer.")
     if not isinstance(save_bibtex, bool):
         raise ValueError("save_bibtex must be a boolean.")
+    if not (isinstance(max_workers, int) and max_workers > 0):
+        raise ValueError("max_workers must be a positive integer.")
     
     # Clean inputs
     query = query.strip()
@@ -234,93 +287,50 @@ def get_web_of_science(query: str, start_year: int, end_year: int, output_dir: s
     full_query = f'TS=("{query}") AND PY=({start_year}-{end_year})'
     logging.info(f"Processing query: {full_query}")
     
-    start_index = 1  # Web of Science uses 1-based indexing
-    batch = 1
-    consecutive_errors = 0
-    max_consecutive_errors = 3
+    url = "https://ws.clarivate.com/api/wos/v1/search"
+    headers = {
+        "Accept": "application/json",
+        "X-ApiKey": API_KEY,
+        "User-Agent": "SystematicReview/1.0"
+    }
+    params = {
+        "usrQuery": full_query,
+        "databaseId": "WOS",
+        "count": WOS_PAGE_SIZE,  # Web of Science max per request
+        "lang": "en"
+    }
     
-    while True:
-        logging.info(f"   Fetching batch {batch}, start_index: {start_index}")
-        url = "https://ws.clarivate.com/api/wos/v1/search"
-        headers = {
-            "Accept": "application/json",
-            "X-ApiKey": API_KEY,
-            "User-Agent": "SystematicReview/1.0"
-        }
-        params = {
-            "usrQuery": full_query,
-            "databaseId": "WOS",
-            "count": 50,  # Web of Science max per request
-            "firstRecord": start_index,
-            "lang": "en"
-        }
-        
-        retries = max_retries
-        while retries >= 0:
-            try:
-                response = make_api_request(url, headers, params, timeout, max_retries)
-                
-                # Validate Web of Science specific response
-                data = validate_wos_response(response)
-                
-                # Check rate limit headers
-                remaining = response.headers.get('X-RateLimit-Remaining')
-                if remaining and int(remaining) < 10:
-                    logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                    time.sleep(10)
-                
-                records = data.get('Records', {}).get('REC', [])
-                if not records:
-                    logging.info("No more records found.")
-                    break
-                
-                # Validate and extract papers
-                valid_papers = 0
-                for record in records:
-                    try:
-                        paper = validate_wos_paper_entry(record)
-                        if paper:  # Only add if validation passed
-                            all_papers.append(paper)
-                            valid_papers += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to process record entry: {e}")
-                        continue
-                
-                total_results = int(data.get('Records', {}).get('@total', 0))
-                start_index += len(records)
-                logging.info(f"Fetched {len(records)} records, {valid_papers} valid. Total so far: {len(all_papers)}. Next start: {start_index}/{total_results}")
-                
-                if start_index > total_results:
-                    break
-                
-                consecutive_errors = 0  # Reset error counter on success
-                time.sleep(1)  # Short sleep between pages
-                break  # Successful fetch, exit retry loop
-            
-            except RateLimitError as e:
-                logging.error(f"Rate limit exceeded: {e}")
-                time.sleep(60)  # Wait 1 minute before retry
-                retries -= 1
-                if retries < 0:
-                    raise WebOfScienceAPIError(f"Rate limit exceeded: {e}")
-                    
-            except ResponseError as e:
-                logging.error(f"API response error: {e}")
-                retries -= 1
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    raise WebOfScienceAPIError(f"Too many consecutive errors ({consecutive_errors})")
-                time.sleep(5 * (max_retries - retries))  # Exponential backoff
-                if retries < 0:
-                    raise WebOfScienceAPIError(f"API response error: {e}")
-                    
-            except Exception as e:
-                logging.error(f"Unexpected error: {e}")
-                retries -= 1
-                if retries < 0:
-                    raise WebOfScienceAPIError(f"Unexpected error: {e}")
+    # The first page tells us how many records there are
+    # (Web of Science uses 1-based indexing)
+    # One limiter paces the first page and the concurrent ones alike
+    limiter = RateLimiter(WOS_REQUESTS_PER_SECOND, low_quota=9, low_quota_wait=10.0)
+    logging.info("   Fetching batch 1, start_index: 1")
+    data = _fetch_wos_page(url, headers, {**params, "firstRecord": 1}, timeout, max_retries, limiter)
+    records = data.get('Records', {}).get('REC', [])
+    all_papers.extend(_extract_wos_papers(records))
+    total_results = int(data.get('Records', {}).get('@total', 0))
+    logging.info(f"Fetched {len(records)} records, {len(all_papers)} valid. Total available: {total_results}")
+    
+    if not records:
+        logging.info("No more records found.")
+    elif total_results > WOS_PAGE_SIZE:
+        specs = [
+            (url, headers, {**params, "firstRecord": first_record})
+            for first_record in range(1 + WOS_PAGE_SIZE, total_results + 1, WOS_PAGE_SIZE)
+        ]
+        logging.info(f"   Fetching {len(specs)} more batches concurrently")
+        try:
+            responses = make_api_requests_bulk(specs, timeout, max_retries, max_workers=max_workers,
+                                               limiter=limiter)
+            pages = [validate_wos_response(response) for response in responses]
+        except (APIError, RequestException) as e:
+            raise WebOfScienceAPIError(f"Failed to fetch results: {e}")
         
-        batch += 1
+        for (_, _, page_params), data in zip(specs, pages):
+            records = data.get('Records', {}).get('REC', [])
+            valid_papers = _extract_wos_papers(records)
+            all_papers.extend(valid_papers)
+            logging.info(f"Fetched {len(records)} records, {len(valid_papers)} valid at start_index {page_params['firstRecord']}/{total_results}")
     
     if not all_papers:
         logging.info("No papers found.")
@@ -337,7 +347,7 @@ def get_web_of_science(query: str, start_year: int, end_year: int, output_dir: s
         if save_bibtex:
             bibtex_filename = f'wos_papers_{start_year}_{end_year}.bib'
             bibtex_path = os.path.join(output_folder, bibtex_filename)
-            save_bibtex(all_papers, bibtex_path)
+            write_bibtex(all_papers, bibtex_path)
         
         logging.info(f"Total unique papers found: {len(final_df)}. Saved to {csv_filename}")
         if save_bibtex:
@@ -1,12 +1,23 @@
 import os
 import requests
-import json
+import orjson
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import time
 import logging
 import re
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, Union, Iterator, Tuple
 from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession, DEFAULT_IGNORED_PARAMS
+from datetime import timedelta
 from dotenv import load_dotenv
 
 # Set up logging
@@ -24,8 +35,116 @@ class ResponseError(APIError):
     pass
 
 class RateLimitError(APIError):
-    """Exception for rate limit exceeded."""
-    pass
+    """
+    Exception for rate limit exceeded.
+    
+    retry_after holds the number of seconds the server asked to wait,
+    or None when the response did not say.
+    """
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Read how long the server asked clients to wait before retrying.
+    
+    Retry-After (seconds or an HTTP date) is used first, then
+    X-RateLimit-Reset (an epoch timestamp or a number of seconds).
+    
+    Args:
+        response: requests.Response object
+        
+    Returns:
+        Seconds to wait (never negative), or None if neither header is usable
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            pass
+    
+    reset = response.headers.get('X-RateLimit-Reset')
+    try:
+        reset = float(reset)
+    except (TypeError, ValueError):
+        return None
+    # Reset is either an epoch timestamp or a number of seconds
+    return max(reset - time.time() if reset > 1e9 else reset, 0.0)
+
+class RateLimiter:
+    """
+    Thread-safe request pacer shared by the workers of one fetcher.
+    
+    Requests are spaced to at most `rate` per second. When the server reports
+    an exhausted quota through X-RateLimit-Remaining, every worker waits until
+    X-RateLimit-Reset (or `exhausted_wait` seconds when no reset is given).
+    While no more than `low_quota` requests remain, each request is delayed by
+    a further `low_quota_wait` seconds to stretch the remaining quota.
+    """
+    
+    def __init__(self, rate: float, exhausted_wait: float = 10.0,
+                 low_quota: int = 0, low_quota_wait: float = 0.2):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.interval = 1.0 / rate
+        self.exhausted_wait = exhausted_wait
+        self.low_quota = low_quota
+        self.low_quota_wait = low_quota_wait
+        self.next_allowed_ts = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """
+        Block until the next request may be sent, reserving its slot.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_allowed_ts)
+            self.next_allowed_ts = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+    
+    def update(self, response: requests.Response) -> None:
+        """
+        Adjust pacing from the rate-limit headers of a response.
+        
+        Responses served from a local cache never reached the server, so
+        their reserved slot is handed back.
+        """
+        if getattr(response, 'from_cache', False):
+            with self._lock:
+                self.next_allowed_ts = max(time.monotonic(), self.next_allowed_ts - self.interval)
+            return
+        
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None or not remaining.isdigit() or int(remaining) > self.low_quota:
+            return
+        
+        if int(remaining) > 0:
+            with self._lock:
+                self.next_allowed_ts = max(self.next_allowed_ts, time.monotonic() + self.low_quota_wait)
+            return
+        
+        delay = retry_after_seconds(response)
+        if delay is None:
+            delay = self.exhausted_wait
+        
+        logging.warning(f"Rate limit quota exhausted. Pausing requests for {delay:.1f}s.")
+        self.pause(delay)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every worker's next request by at least `seconds`.
+        """
+        with self._lock:
+            self.next_allowed_ts = max(self.next_allowed_ts, time.monotonic() + seconds)
 
 def validate_api_response(response: requests.Response, expected_content_type: str = 'application/json') -> Dict[str, Any]:
     """
@@ -53,8 +172,8 @@ def validate_api_response(response: requests.Response, expected_content_type: st
         
         # Parse JSON
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise ResponseError(f"Invalid JSON response: {e}")
         
         # Validate response structure
@@ -66,7 +185,7 @@ def validate_api_response(response: requests.Response, expected_content_type: st
     except HTTPError as e:
         status_code = response.status_code
         if status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
+            raise RateLimitError("Rate limit exceeded", retry_after=retry_after_seconds(response))
         elif status_code == 401:
             raise ResponseError("Authentication failed - check API key")
         elif status_code == 403:
@@ -80,6 +199,24 @@ def validate_api_response(response: requests.Response, expected_content_type: st
     except RequestException as e:
         raise ResponseError(f"Network error: {e}")
 
+# Keys under which the APIs report each text field, in order of preference
+_PAPER_FIELD_KEYS = {
+    "doi": ("doi", "prism:doi"),
+    "title": ("title", "dc:title"),
+    "authors": ("authors", "dc:creator", "author"),
+    "year": ("year", "prism:coverDisplayDate", "publicationYear"),
+    "publicationName": ("publicationName", "prism:publicationName", "journal"),
+    "url": ("url", "prism:url"),
+}
+
+def _first_str(entry: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    """Return the first non-empty string value among the given keys, or None."""
+    for key in keys:
+        value = entry.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
 def validate_paper_entry(entry: Dict[str, Any], required_fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Validate and clean a paper entry from the API response.
@@ -98,31 +235,24 @@ def validate_paper_entry(entry: Dict[str, Any], required_fields: Optional[List[s
     # Extract and validate required fields
     paper = {}
     
-    # DOI - can be None but should be string if present
-    doi = entry.get("doi") or entry.get("prism:doi")
-    if doi is not None and not isinstance(doi, str):
-        logging.warning(f"Invalid DOI type: {type(doi)}")
-        doi = None
-    paper["doi"] = doi
+    # DOI - can be None
+    paper["doi"] = _first_str(entry, _PAPER_FIELD_KEYS["doi"])
     
     # Title - required field
-    title = entry.get("title") or entry.get("dc:title")
-    if not title or not isinstance(title, str):
-        logging.warning(f"Missing or invalid title: {title}")
+    title = _first_str(entry, _PAPER_FIELD_KEYS["title"])
+    if title is None:
+        logging.warning(f"Missing or invalid title: {entry.get('title') or entry.get('dc:title')}")
         paper["title"] = "Unknown Title"
     else:
         paper["title"] = title.strip()
     
-    # Authors - can be None but should be string if present
-    authors = entry.get("authors") or entry.get("dc:creator") or entry.get("author")
-    if authors is not None and not isinstance(authors, str):
-        logging.warning(f"Invalid authors type: {type(authors)}")
-        authors = None
-    paper["authors"] = authors
+    # Authors - can be None
+    paper["authors"] = _first_str(entry, _PAPER_FIELD_KEYS["authors"])
     
     # Year - validate and convert
-    year_str = entry.get("year") or entry.get("prism:coverDisplayDate") or entry.get("publicationYear")
-    if year_str and isinstance(year_str, str):
+    year_str = _first_str(entry, _PAPER_FIELD_KEYS["year"])
+    paper["year"] = None
+    if year_str is not None:
         try:
             # Extract year from date string (e.g., "2010" or "2010-01-01")
             year = int(year_str.split('-')[0])
@@ -130,26 +260,16 @@ def validate_paper_entry(entry: Dict[str, Any], required_fields: Optional[List[s
                 paper["year"] = year
             else:
                 logging.warning(f"Year out of reasonable range: {year}")
-                paper["year"] = None
-        except (ValueError, IndexError):
+        except ValueError:
             logging.warning(f"Invalid year format: {year_str}")
-            paper["year"] = None
-    else:
-        paper["year"] = None
     
     # Publication name
-    pub_name = entry.get("publicationName") or entry.get("prism:publicationName") or entry.get("journal")
-    if pub_name and isinstance(pub_name, str):
-        paper["publicationName"] = pub_name.strip()
-    else:
-        paper["publicationName"] = None
+    pub_name = _first_str(entry, _PAPER_FIELD_KEYS["publicationName"])
+    paper["publicationName"] = pub_name.strip() if pub_name is not None else None
     
     # URL
-    url = entry.get("url") or entry.get("prism:url")
-    if url and isinstance(url, str):
-        paper["url"] = url.strip()
-    else:
-        paper["url"] = None
+    url = _first_str(entry, _PAPER_FIELD_KEYS["url"])
+    paper["url"] = url.strip() if url is not None else None
     
     # Citation count
     cited_count = entry.get("citedby-count") or entry.get("citationCount") or entry.get("citations")
@@ -171,7 +291,129 @@ def validate_paper_entry(entry: Dict[str, Any], required_fields: Optional[List[s
     
     return paper
 
-def clean_bibtex_key(title: str, authors: str, year: Optional[int], doi: Optional[str] = None, existing_keys: Optional[set] = None) -> str:
+def records_to_frame(records: List[Any], fields: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Build a DataFrame holding only the given fields of raw API entries.
+    
+    Each column is gathered straight into its own list, so the unused
+    fields of an entry are never copied. Columns are kept as raw objects
+    without dtype inference; the column cleaners convert them afterwards.
+    Non-dictionary entries are skipped.
+    
+    Args:
+        records: Raw entries from an API response
+        fields: Keys to keep, one column each
+        
+    Returns:
+        DataFrame with one row per dictionary entry
+    """
+    records = [record for record in records if isinstance(record, dict)]
+    return pd.DataFrame({field: [record.get(field) for record in records] for field in fields},
+                        columns=list(fields), dtype=object)
+
+def frame_column(frame: pd.DataFrame, name: str) -> pd.Series:
+    """
+    Get a column from a DataFrame, or an all-None column if it is missing.
+    
+    Args:
+        frame: DataFrame built from raw API entries
+        name: Column name
+        
+    Returns:
+        Column as a Series aligned with the frame's index
+    """
+    if name in frame:
+        return frame[name]
+    return pd.Series(None, index=frame.index, dtype=object)
+
+def clean_text_column(series: pd.Series) -> pd.Series:
+    """
+    Vectorised string cleaning for a batch of entries.
+    
+    Strips string values; missing, empty and non-string values become None.
+    
+    Args:
+        series: Raw column values
+        
+    Returns:
+        Cleaned object Series
+    """
+    # Checked per value, so columns holding no strings at all (only
+    # numbers or lists) are handled too
+    return pd.Series([value.strip() or None if isinstance(value, str) else None for value in series],
+                     index=series.index, dtype=object)
+
+def clean_year_column(series: pd.Series) -> pd.Series:
+    """
+    Vectorised year conversion for a batch of entries.
+    
+    Args:
+        series: Raw year values (e.g., "2010")
+        
+    Returns:
+        Nullable integer Series; invalid or out-of-range years are missing
+    """
+    # Numeric years (e.g. JSON integers) are used as they are; strings are stripped first
+    is_text = pd.Series([isinstance(value, str) for value in series], index=series.index, dtype=bool)
+    years = pd.to_numeric(series.astype(object).where(~is_text, clean_text_column(series)), errors='coerce')
+    years = years.where(years.between(1900, 2030) & (years % 1 == 0))  # Reasonable year range
+    return years.astype('Int64')
+
+def drop_seen_papers(papers: pd.DataFrame, seen: set) -> pd.DataFrame:
+    """
+    Drop papers whose DOI was already collected, so duplicates are removed
+    batch by batch rather than only at save time.
+    
+    Papers without a DOI can't be told apart reliably (e.g. "Editorial" or
+    "Unknown Title"), so like save_results_to_csv they are all kept. New
+    DOIs are added to seen. Pass batches in page order so the same copy of
+    a paper is kept on every run.
+    
+    Args:
+        papers: DataFrame of papers with a doi column
+        seen: Set of DOIs of the papers collected so far
+        
+    Returns:
+        DataFrame of papers not seen before
+    """
+    keep = []
+    for doi in papers['doi']:
+        if not isinstance(doi, str) or not doi:
+            keep.append(True)
+        elif doi in seen:
+            keep.append(False)
+        else:
+            seen.add(doi)
+            keep.append(True)
+    return papers[keep]
+
+def iter_papers(frame: pd.DataFrame, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the papers of a DataFrame one at a time as dictionaries.
+    
+    Missing values (NaN/NA) are converted to None so that the
+    dictionaries can be used like the output of validate_paper_entry.
+    Rows are converted chunk by chunk, so writers can stream them to disk
+    without holding a dictionary for every paper in memory at once.
+    
+    Args:
+        frame: DataFrame of papers
+        chunk_size: Number of rows converted at a time
+        
+    Yields:
+        Paper dictionaries
+    """
+    for start in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[start:start + chunk_size]
+        yield from chunk.astype(object).where(chunk.notna(), None).to_dict('records')
+
+# Patterns used by clean_bibtex_key, compiled once rather than per entry
+_AUTHOR_SEP = re.compile(r'[,;]')
+_NON_WORD_SPACE = re.compile(r'[^\w\s]')
+_NON_WORD = re.compile(r'[^\w]')
+
+def clean_bibtex_key(title: str, authors: str, year: Optional[int], doi: Optional[str] = None, existing_keys: Optional[set] = None,
+                     suffix_counts: Optional[Dict[str, int]] = None) -> str:
     """
     Generate a clean BibTeX key from title, authors, and year.
     Format: lastname + year + firstword (with suffix if duplicate)
@@ -182,6 +424,7 @@ def clean_bibtex_key(title: str, authors: str, year: Optional[int], doi: Optiona
         year: Publication year
         doi: DOI for uniqueness (optional)
         existing_keys: Set of existing keys to check for duplicates
+        suffix_counts: Next suffix to try for each base key, updated in place
         
     Returns:
         Clean BibTeX key
@@ -189,7 +432,7 @@ def clean_bibtex_key(title: str, authors: str, year: Optional[int], doi: Optiona
     # Extract first author's last name
     if authors:
         # Split by common separators and get first author
-        author_parts = re.split(r'[,;]', authors.strip())
+        author_parts = _AUTHOR_SEP.split(authors.strip())
         first_author = author_parts[0].strip()
         # Extract last name (everything after last space)
         last_name = first_author.split()[-1] if first_author else "unknown"
@@ -199,7 +442,7 @@ def clean_bibtex_key(title: str, authors: str, year: Optional[int], doi: Optiona
     # Get first word from title
     if title:
         # Remove special characters and get first word
-        clean_title = re.sub(r'[^\w\s]', '', title.lower())
+        clean_title = _NON_WORD_SPACE.sub('', title.lower())
         words = clean_title.split()
         if words:
             first_word = words[0]
@@ -213,38 +456,64 @@ def clean_bibtex_key(title: str, authors: str, year: Optional[int], doi: Optiona
     base_key = f"{last_name}{year_part}{first_word}"
     
     # Clean the base key (remove special characters, limit length)
-    base_key = re.sub(r'[^\w]', '', base_key)[:50]  # Limit to 50 chars
+    base_key = _NON_WORD.sub('', base_key)[:50]  # Limit to 50 chars
     
     # Check for duplicates and add suffix if needed
     if existing_keys is None:
         existing_keys = set()
-    
-    key = base_key
-    suffix = 1
-    
-    while key in existing_keys:
-        # Add suffix to make it unique
-        suffix_key = f"{base_key}{suffix}"
-        if len(suffix_key) <= 50:  # Still within length limit
-            key = suffix_key
+    if suffix_counts is None:
+        suffix_counts = {}
+    
+    # Resume from the next unused suffix of this base key, so a base key
+    # shared by many papers doesn't re-test all the earlier suffixes
+    suffix = suffix_counts.get(base_key, 0)
+    while True:
+        if suffix == 0:
+            key = base_key
         else:
-            # If too long, truncate base key and add suffix
-            max_base_length = 50 - len(str(suffix))
-            key = f"{base_key[:max_base_length]}{suffix}"
+            # Add suffix to make it unique
+            suffix_key = f"{base_key}{suffix}"
+            if len(suffix_key) <= 50:  # Still within length limit
+                key = suffix_key
+            else:
+                # If too long, truncate base key and add suffix
+                max_base_length = 50 - len(str(suffix))
+                key = f"{base_key[:max_base_length]}{suffix}"
+        if key not in existing_keys:
+            break
         suffix += 1
+    suffix_counts[base_key] = suffix + 1
     
     return key
 
-def paper_to_bibtex(paper: Dict[str, Any], existing_keys: Optional[set] = None) -> str:
+# One field line of a BibTeX entry, including the separator before it
+_BIBTEX_FIELD = ",\n  {} = {{{}}}"
+
+# Characters with a special meaning in BibTeX/LaTeX, escaped in a single
+# str.translate pass per field
+_BIBTEX_ESCAPE = str.maketrans({
+    '\\': '\\textbackslash{}',
+    '{': '\\{',
+    '}': '\\}',
+    '&': '\\&',
+    '%': '\\%',
+    '$': '\\$',
+    '#': '\\#',
+    '_': '\\_',
+})
+
+def paper_to_bibtex(paper: Dict[str, Any], existing_keys: Optional[set] = None,
+                    suffix_counts: Optional[Dict[str, int]] = None) -> Tuple[str, str]:
     """
     Convert a paper dictionary to BibTeX format.
     
     Args:
         paper: Paper dictionary with API data
         existing_keys: Set of existing keys to avoid duplicates
+        suffix_counts: Next key suffix per base key (see clean_bibtex_key)
         
     Returns:
-        BibTeX entry as string
+        Tuple of (BibTeX key, BibTeX entry as string)
     """
     # Generate BibTeX key
     key = clean_bibtex_key(
@@ -252,54 +521,54 @@ def paper_to_bibtex(paper: Dict[str, Any], existing_keys: Optional[set] = None)
         paper.get('authors', ''), 
         paper.get('year'),
         paper.get('doi'),
-        existing_keys
+        existing_keys,
+        suffix_counts
     )
     
-    # Start BibTeX entry
-    bibtex = f"@article{{{key},\n"
-    
-    # Add fields
+    # Collect the field lines, then build the entry in a single join
+    fields = []
     if paper.get('title'):
         # Escape special characters in title
-        title = paper['title'].replace('{', '\\{').replace('}', '\\}')
-        bibtex += f"  title = {{{title}}},\n"
+        fields.append(_BIBTEX_FIELD.format('title', paper['title'].translate(_BIBTEX_ESCAPE)))
     
     if paper.get('authors'):
         # Clean and format authors
-        authors = paper['authors'].replace('{', '\\{').replace('}', '\\}')
-        bibtex += f"  author = {{{authors}}},\n"
+        fields.append(_BIBTEX_FIELD.format('author', paper['authors'].translate(_BIBTEX_ESCAPE)))
     
     if paper.get('year'):
-        bibtex += f"  year = {{{paper['year']}}},\n"
+        fields.append(_BIBTEX_FIELD.format('year', paper['year']))
     
     if paper.get('publicationName'):
-        journal = paper['publicationName'].replace('{', '\\{').replace('}', '\\}')
-        bibtex += f"  journal = {{{journal}}},\n"
+        fields.append(_BIBTEX_FIELD.format('journal', paper['publicationName'].translate(_BIBTEX_ESCAPE)))
     
     if paper.get('doi'):
-        bibtex += f"  doi = {{{paper['doi']}}},\n"
+        fields.append(_BIBTEX_FIELD.format('doi', paper['doi']))
     
     if paper.get('url'):
-        bibtex += f"  url = {{{paper['url']}}},\n"
+        fields.append(_BIBTEX_FIELD.format('url', paper['url']))
     
     if paper.get('citedby-count', 0) > 0:
-        bibtex += f"  note = {{Citations: {paper['citedby-count']}}},\n"
+        fields.append(_BIBTEX_FIELD.format('note', f"Citations: {paper['citedby-count']}"))
     
-    # Remove trailing comma and close
-    bibtex = bibtex.rstrip(',\n') + '\n}\n\n'
+    bibtex = "".join([f"@article{{{key}", *fields, "\n}\n\n"])
     
-    return bibtex
+    return key, bibtex
 
-def save_bibtex(papers: List[Dict[str, Any]], output_path: str) -> None:
+# Write buffer for BibTeX files (1 MiB)
+BIBTEX_WRITE_BUFFER = 1 << 20
+
+def save_bibtex(papers: Union[List[Dict[str, Any]], pd.DataFrame], output_path: str) -> None:
     """
     Save papers to BibTeX file.
+    DataFrame rows are streamed to the file as they are converted; a large
+    write buffer batches the entries into few system calls.
     
     Args:
-        papers: List of paper dictionaries
+        papers: List of paper dictionaries or DataFrame of papers
         output_path: Path to save BibTeX file
     """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=BIBTEX_WRITE_BUFFER) as f:
             # Write header comment
             f.write(f"% BibTeX entries generated from API\n")
             f.write(f"% Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -307,19 +576,14 @@ def save_bibtex(papers: List[Dict[str, Any]], output_path: str) -> None:
             
             # Track existing keys to avoid duplicates
             existing_keys = set()
+            suffix_counts = {}
             
             # Write each paper
-            for paper in papers:
-                bibtex_entry = paper_to_bibtex(paper, existing_keys)
+            entries = iter_papers(papers) if isinstance(papers, pd.DataFrame) else papers
+            for paper in entries:
+                key, bibtex_entry = paper_to_bibtex(paper, existing_keys, suffix_counts)
+                existing_keys.add(key)
                 f.write(bibtex_entry)
-                
-                # Extract the key from the entry and add to existing keys
-                # The key is between @article{ and the first comma
-                key_start = bibtex_entry.find('@article{') + 9
-                key_end = bibtex_entry.find(',', key_start)
-                if key_end != -1:
-                    key = bibtex_entry[key_start:key_end]
-                    existing_keys.add(key)
         
         logging.info(f"BibTeX file saved to: {output_path}")
         
@@ -327,12 +591,12 @@ def save_bibtex(papers: List[Dict[str, Any]], output_path: str) -> None:
         logging.error(f"Error saving BibTeX file: {e}")
         raise APIError(f"Failed to save BibTeX file: {e}")
 
-def save_results_to_csv(papers: List[Dict[str, Any]], output_path: str) -> pd.DataFrame:
+def save_results_to_csv(papers: Union[List[Dict[str, Any]], pd.DataFrame], output_path: str) -> pd.DataFrame:
     """
     Save papers to CSV file and return DataFrame.
     
     Args:
-        papers: List of paper dictionaries
+        papers: List of paper dictionaries or DataFrame of papers
         output_path: Path to save CSV file
         
     Returns:
@@ -341,22 +605,25 @@ def save_results_to_csv(papers: List[Dict[str, Any]], output_path: str) -> pd.Da
     try:
         df = pd.DataFrame(papers)
         
-        # Remove rows with missing DOIs for deduplication
-        df_with_doi = df[df['doi'].notna()]
-        df_without_doi = df[df['doi'].isna()]
-        
-        # Deduplicate by DOI
-        final_df = df_with_doi.drop_duplicates(subset='doi')
+        # Deduplicate by DOI in a single hash pass; papers without DOI
+        # can't be deduplicated and are all kept
+        missing_doi = df['doi'].isna().to_numpy()
+        duplicate_doi = df['doi'].duplicated().to_numpy() & ~missing_doi
         
-        # Add back papers without DOI (they can't be deduplicated)
-        final_df = pd.concat([final_df, df_without_doi], ignore_index=True)
+        # Papers with DOI first, then papers without DOI, in one take
+        order = np.concatenate([np.flatnonzero(~missing_doi & ~duplicate_doi), np.flatnonzero(missing_doi)])
+        final_df = df.take(order).reset_index(drop=True)
         
-        # Save to CSV
-        final_df.to_csv(output_path, index=False)
+        # Save to CSV with Arrow's vectorised writer; columns it cannot
+        # write (e.g. lists of keywords) fall back to pandas
+        try:
+            pa_csv.write_csv(pa.Table.from_pandas(final_df, preserve_index=False), output_path)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            final_df.to_csv(output_path, index=False)
         
         logging.info(f"CSV file saved to: {output_path}")
         logging.info(f"Total unique papers: {len(final_df)}")
-        logging.info(f"Papers with DOI: {len(df_with_doi)}, Papers without DOI: {len(df_without_doi)}")
+        logging.info(f"Papers with DOI: {int((~missing_doi).sum())}, Papers without DOI: {int(missing_doi.sum())}")
         
         return final_df
         
@@ -364,8 +631,183 @@ def save_results_to_csv(papers: List[Dict[str, Any]], output_path: str) -> pd.Da
         logging.error(f"Error saving CSV file: {e}")
         raise APIError(f"Failed to save CSV file: {e}")
 
+def save_results_to_parquet(papers: pd.DataFrame, output_path: str) -> bool:
+    """
+    Save papers to a zstd-compressed Parquet file.
+    
+    Unlike CSV, Parquet keeps column types (e.g. integer years) and stores
+    list columns such as keywords natively, so reloading needs no re-parsing.
+    The Parquet file is only a convenience copy of the CSV, so a failure is
+    logged and any partial file removed instead of failing the search.
+    
+    Args:
+        papers: DataFrame of papers
+        output_path: Path to save Parquet file
+        
+    Returns:
+        True if the file was written, False otherwise
+    """
+    try:
+        papers.to_parquet(output_path, compression='zstd', index=False)
+        logging.info(f"Parquet file saved to: {output_path}")
+        return True
+        
+    except Exception as e:
+        logging.warning(f"Parquet copy not saved: {e}")
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        return False
+
+class PaperStreamWriter:
+    """
+    Append batches of papers to CSV, BibTeX and Parquet files as they arrive.
+    
+    Lets a fetcher write each page as soon as it is cleaned instead of
+    collecting every page first, so peak memory grows with the page size
+    rather than with the total number of results. Papers whose DOI was
+    already written are dropped, the same DOI pass save_results_to_csv makes,
+    so both ways of saving write the same papers. write() is thread-safe.
+    A Parquet failure only stops the Parquet copy; CSV and BibTeX go on.
+    """
+    
+    def __init__(self, csv_path: str, bibtex_path: Optional[str] = None,
+                 parquet_path: Optional[str] = None):
+        self.csv_path = csv_path
+        self.bibtex_path = bibtex_path
+        self.parquet_path = parquet_path
+        self.paper_count = 0
+        self._lock = threading.Lock()
+        self._csv_file = None
+        self._bibtex_file = None
+        self._parquet_writer = None
+        self._parquet_schema = None
+        self._existing_keys = set()
+        self._suffix_counts = {}
+        self._seen_dois = set()
+        try:
+            self._csv_file = open(csv_path, 'w', encoding='utf-8', newline='')
+            if bibtex_path:
+                self._bibtex_file = open(bibtex_path, 'w', encoding='utf-8', buffering=BIBTEX_WRITE_BUFFER)
+                self._bibtex_file.write(f"% BibTeX entries generated from API\n")
+                self._bibtex_file.write(f"% Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        except OSError as e:
+            self.close()
+            raise APIError(f"Failed to open output files: {e}")
+    
+    def write(self, papers: pd.DataFrame) -> None:
+        """
+        Append the papers of a batch that weren't written yet to every output file.
+        """
+        with self._lock:
+            papers = drop_seen_papers(papers, self._seen_dois)
+            if papers.empty:
+                return
+            try:
+                papers.to_csv(self._csv_file, index=False, header=self.paper_count == 0)
+                if self._bibtex_file is not None:
+                    for paper in iter_papers(papers):
+                        key, bibtex_entry = paper_to_bibtex(paper, self._existing_keys, self._suffix_counts)
+                        self._existing_keys.add(key)
+                        self._bibtex_file.write(bibtex_entry)
+            except Exception as e:
+                logging.error(f"Error writing papers: {e}")
+                raise APIError(f"Failed to write papers: {e}")
+            if self.parquet_path:
+                self._write_parquet(papers)
+            self.paper_count += len(papers)
+    
+    def _write_parquet(self, papers: pd.DataFrame) -> None:
+        try:
+            if self._parquet_writer is None:
+                # Columns that are still all-missing in the first batch are
+                # typed as strings, so later batches can fill them
+                schema = pa.Schema.from_pandas(papers, preserve_index=False)
+                self._parquet_schema = pa.schema([
+                    field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                    for field in schema
+                ])
+                self._parquet_writer = pq.ParquetWriter(self.parquet_path, self._parquet_schema, compression='zstd')
+            self._parquet_writer.write_table(
+                pa.Table.from_pandas(papers, schema=self._parquet_schema, preserve_index=False))
+        except (pa.ArrowException, OSError) as e:
+            logging.warning(f"Parquet copy not saved: {e}")
+            if self._parquet_writer is not None:
+                self._parquet_writer.close()
+                self._parquet_writer = None
+            if os.path.exists(self.parquet_path):
+                os.remove(self.parquet_path)
+            self.parquet_path = None
+    
+    def close(self) -> None:
+        """
+        Flush and close every output file.
+        """
+        for handle in (self._csv_file, self._bibtex_file, self._parquet_writer):
+            if handle is not None:
+                handle.close()
+        self._csv_file = self._bibtex_file = self._parquet_writer = None
+    
+    def __enter__(self) -> "PaperStreamWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# On-disk HTTP cache of the default session. Expired entries that carry an
+# ETag or Last-Modified header are revalidated with a conditional GET, so an
+# unchanged record comes back as a small 304 instead of a full response.
+API_CACHE_NAME = os.path.join('.http_cache', 'api')
+API_CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+# Credentials are left out of cache keys and redacted from the stored
+# requests; on top of requests-cache's defaults this covers the API key
+# headers of Web of Science and Scopus
+API_CACHE_IGNORED_PARAMS = (*DEFAULT_IGNORED_PARAMS, 'X-ApiKey', 'X-ELS-APIKey')
+
+# Shared by every make_api_request call that isn't given a session, so
+# connections are pooled across calls; created on first use
+_DEFAULT_SESSION: Optional[requests.Session] = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+def _default_session() -> requests.Session:
+    """
+    Return the shared default session, creating it on first use.
+    """
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            session = CachedSession(
+                API_CACHE_NAME,
+                backend='sqlite',
+                expire_after=API_CACHE_EXPIRE_AFTER,
+                cache_control=True,  # Honour the server's Cache-Control headers
+                allowable_codes=(200,),
+                allowable_methods=('GET',),
+                ignored_parameters=API_CACHE_IGNORED_PARAMS,
+            )
+            session.verify = True  # Enable SSL verification
+            
+            # Add retry strategy for SSL issues
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _DEFAULT_SESSION = session
+        return _DEFAULT_SESSION
+
+# Once fewer than LOW_QUOTA_REMAINING requests remain, a request made without
+# a limiter sleeps LOW_QUOTA_WAIT seconds to let the quota recover
+LOW_QUOTA_REMAINING = 10
+LOW_QUOTA_WAIT = 10.0
+
 def make_api_request(url: str, headers: Dict[str, str], params: Dict[str, Any], 
-                    timeout: int = 30, max_retries: int = 3) -> requests.Response:
+                    timeout: int = 30, max_retries: int = 3,
+                    session: Optional[requests.Session] = None,
+                    limiter: Optional[RateLimiter] = None) -> requests.Response:
     """
     Make an API request with retry logic.
     
@@ -375,6 +817,11 @@ def make_api_request(url: str, headers: Dict[str, str], params: Dict[str, Any],
         params: Query parameters
         timeout: Request timeout in seconds
         max_retries: Maximum number of retries
+        session: Session to send the request with (defaults to a shared pooled session)
+        limiter: Rate limiter shared with other workers (optional); it paces
+            the requests from their rate-limit headers, and rate-limit waits
+            pause all of the workers together. Without one, the request sleeps
+            LOW_QUOTA_WAIT seconds once fewer than LOW_QUOTA_REMAINING remain
         
     Returns:
         requests.Response object
@@ -389,39 +836,33 @@ def make_api_request(url: str, headers: Dict[str, str], params: Dict[str, Any],
     
     while retries >= 0:
         try:
-            # Add SSL verification settings for better compatibility
-            session = requests.Session()
-            session.verify = True  # Enable SSL verification
-            
-            # Add retry strategy for SSL issues
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.retry import Retry
-            
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            
-            response = session.get(url, headers=headers, params=params, timeout=timeout)
+            request_session = session if session is not None else _default_session()
+            if limiter is not None:
+                limiter.wait()
+            response = request_session.get(url, headers=headers, params=params, timeout=timeout)
+            if limiter is not None:
+                limiter.update(response)
             
             # Validate response
             validate_api_response(response)
             
-            # Check rate limit headers
+            # Without a shared limiter, check the rate limit headers here
             remaining = response.headers.get('X-RateLimit-Remaining')
-            if remaining and int(remaining) < 10:
-                logging.warning(f"Low remaining requests: {remaining}. Sleeping 10s.")
-                time.sleep(10)
+            if (limiter is None and not getattr(response, 'from_cache', False)
+                    and remaining and remaining.isdigit() and int(remaining) < LOW_QUOTA_REMAINING):
+                logging.warning(f"Low remaining requests: {remaining}. Sleeping {LOW_QUOTA_WAIT:.0f}s.")
+                time.sleep(LOW_QUOTA_WAIT)
             
             return response
             
         except RateLimitError as e:
             logging.error(f"Rate limit exceeded: {e}")
-            time.sleep(60)  # Wait 1 minute before retry
+            # Wait as long as the server asked, or 1 minute before retry
+            delay = e.retry_after if e.retry_after is not None else 60
+            if limiter is not None:
+                limiter.pause(delay)  # Every worker waits, not just this one
+            else:
+                time.sleep(delay)
             retries -= 1
             if retries < 0:
                 raise
@@ -450,4 +891,49 @@ def make_api_request(url: str, headers: Dict[str, str], params: Dict[str, Any],
             logging.error(f"Unexpected error: {e}")
             retries -= 1
             if retries < 0:
-                raise 
\ No newline at end of file
+                raise 
+
+# Overall request rate of make_api_requests_bulk when no limiter is given
+BULK_REQUESTS_PER_SECOND = 5.0
+
+def make_api_requests_bulk(specs: List[Tuple[str, Dict[str, str], Dict[str, Any]]],
+                           timeout: int = 30, max_retries: int = 3, max_workers: int = 8,
+                           session: Optional[requests.Session] = None,
+                           limiter: Optional[RateLimiter] = None) -> List[requests.Response]:
+    """
+    Make several API requests concurrently over one pooled session.
+    
+    Each request goes through make_api_request. All of them share one rate
+    limiter, so the overall request rate stays within quota and a rate-limit
+    wait pauses every worker instead of each one retrying on its own.
+    
+    Args:
+        specs: (url, headers, params) of each request
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries per request
+        max_workers: Maximum number of concurrent requests
+        session: Session to send the requests with (defaults to a shared pooled session)
+        limiter: Rate limiter to share (defaults to BULK_REQUESTS_PER_SECOND,
+            slowing down like a lone request once the quota runs low)
+        
+    Returns:
+        Responses in the same order as specs
+        
+    Raises:
+        APIError: If any request fails for good; queued requests are cancelled
+    """
+    if limiter is None:
+        limiter = RateLimiter(BULK_REQUESTS_PER_SECOND, low_quota=LOW_QUOTA_REMAINING - 1,
+                              low_quota_wait=LOW_QUOTA_WAIT)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(make_api_request, url, headers, params, timeout, max_retries, session, limiter)
+            for url, headers, params in specs
+        ]
+        try:
+            return [future.result() for future in futures]
+        except Exception:
+            # Don't wait for queued requests once one has failed for good
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
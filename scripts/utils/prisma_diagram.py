@@ -1,46 +1,50 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
-def create_prisma_diagram(numbers_dict):
-    """Create PRISMA flow diagram"""
-    fig, ax = plt.subplots(1, 1, figsize=(12, 16))
-    
-    # Define boxes and their positions
-    boxes = {
-        'identification': {
-            'text': f"Records identified through\ndatabase searching\n(n = {numbers_dict['total_identified']})",
-            'pos': (0.5, 0.9),
-            'size': (0.3, 0.08)
-        },
-        'screening': {
-            'text': f"Records screened\n(n = {numbers_dict['screened']})",
-            'pos': (0.5, 0.7),
-            'size': (0.3, 0.06)
-        },
-        'excluded_screening': {
-            'text': f"Records excluded\n(n = {numbers_dict['excluded_screening']})",
-            'pos': (0.85, 0.7),
-            'size': (0.25, 0.06)
-        },
-        'eligibility': {
-            'text': f"Full-text articles assessed\nfor eligibility\n(n = {numbers_dict['full_text_assessed']})",
-            'pos': (0.5, 0.5),
-            'size': (0.3, 0.08)
-        },
-        'excluded_eligibility': {
-            'text': f"Full-text articles excluded\n(n = {numbers_dict['excluded_eligibility']})",
-            'pos': (0.85, 0.5),
-            'size': (0.25, 0.06)
-        },
-        'included': {
-            'text': f"Studies included in\nqualitative synthesis\n(n = {numbers_dict['included']})",
-            'pos': (0.5, 0.3),
-            'size': (0.3, 0.08)
-        }
+# Boxes of the diagram: label template, centre position and size
+_BOXES = {
+    'identification': {
+        'text': "Records identified through\ndatabase searching\n(n = {total_identified})",
+        'pos': (0.5, 0.9),
+        'size': (0.3, 0.08)
+    },
+    'screening': {
+        'text': "Records screened\n(n = {screened})",
+        'pos': (0.5, 0.7),
+        'size': (0.3, 0.06)
+    },
+    'excluded_screening': {
+        'text': "Records excluded\n(n = {excluded_screening})",
+        'pos': (0.85, 0.7),
+        'size': (0.25, 0.06)
+    },
+    'eligibility': {
+        'text': "Full-text articles assessed\nfor eligibility\n(n = {full_text_assessed})",
+        'pos': (0.5, 0.5),
+        'size': (0.3, 0.08)
+    },
+    'excluded_eligibility': {
+        'text': "Full-text articles excluded\n(n = {excluded_eligibility})",
+        'pos': (0.85, 0.5),
+        'size': (0.25, 0.06)
+    },
+    'included': {
+        'text': "Studies included in\nqualitative synthesis\n(n = {included})",
+        'pos': (0.5, 0.3),
+        'size': (0.3, 0.08)
     }
+}
+
+# Figure and box label artists kept for create_prisma_diagram(reuse=True), per matplotlib backend
+_DIAGRAM_CACHE = {}
+
+def _build_prisma_diagram():
+    """Draw the diagram once, returning the figure and its box label artists"""
+    fig, ax = plt.subplots(1, 1, figsize=(12, 16))
     
     # Draw boxes
-    for box_name, box_info in boxes.items():
+    labels = {}
+    for box_name, box_info in _BOXES.items():
         rect = patches.Rectangle(
             (box_info['pos'][0] - box_info['size'][0]/2, 
              box_info['pos'][1] - box_info['size'][1]/2),
@@ -48,8 +52,8 @@ def create_prisma_diagram(numbers_dict):
             linewidth=2, edgecolor='black', facecolor='lightblue'
         )
         ax.add_patch(rect)
-        ax.text(box_info['pos'][0], box_info['pos'][1], box_info['text'],
-                ha='center', va='center', fontsize=10, weight='bold')
+        labels[box_name] = ax.text(box_info['pos'][0], box_info['pos'][1], '',
+                                   ha='center', va='center', fontsize=10, weight='bold')
     
     # Draw arrows
     arrows = [
@@ -70,6 +74,34 @@ def create_prisma_diagram(numbers_dict):
     ax.set_title('PRISMA Flow Diagram', fontsize=16, weight='bold', pad=20)
     
     plt.tight_layout()
+    return fig, labels
+
+def _set_prisma_labels(labels, numbers_dict):
+    """Fill the box labels of a built diagram with numbers_dict"""
+    for box_name, label in labels.items():
+        label.set_text(_BOXES[box_name]['text'].format(**numbers_dict))
+
+def create_prisma_diagram(numbers_dict, reuse=False):
+    """Create PRISMA flow diagram
+
+    Each call returns a new figure. With reuse=True the figure built by the
+    last reuse=True call (per backend) is returned again with only the
+    numbers in its box labels updated, which is much faster when refreshing
+    a diagram; that figure is then changed for every holder of it.
+    """
+    if not reuse:
+        fig, labels = _build_prisma_diagram()
+        _set_prisma_labels(labels, numbers_dict)
+        return fig
+    
+    backend = plt.get_backend()
+    cached = _DIAGRAM_CACHE.get(backend)
+    if cached is None or not plt.fignum_exists(cached[0].number):
+        cached = _DIAGRAM_CACHE[backend] = _build_prisma_diagram()
+    fig, labels = cached
+    
+    _set_prisma_labels(labels, numbers_dict)
+    fig.canvas.draw_idle()
     return fig
 
 # Example usage
@@ -1,6 +1,8 @@
-from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer  # type: ignore
+import numpy as np
 import pandas as pd
+import re
+from functools import lru_cache
 
 def standardize_records(records):
     """Standardize records from different sources"""
@@ -21,48 +23,128 @@ def standardize_records(records):
     
     return pd.DataFrame(standardized)
 
-def remove_duplicates(df):
-    """Remove duplicate records based on title similarity"""
+# Rows of the title similarity matrix computed at a time
+SIMILARITY_BLOCK_ROWS = 2000
 
-    # Create TF-IDF vectors for titles
-    vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-    tfidf_matrix = vectorizer.fit_transform(df['title'].fillna(''))
+def remove_duplicates(df, method='tfidf'):
+    """Remove duplicate records based on title similarity
+
+    method='tfidf' compares TF-IDF vectors of the title words (cosine > 0.8);
+    method='minhash' compares character 3-shingles of the titles with MinHash
+    LSH (Jaccard ~0.8), which scales to very large record sets.
+    """
+
+    if method not in ('tfidf', 'minhash'):
+        raise ValueError(f"Unknown duplicate detection method: {method}")
+    # Nothing to compare; the vectoriser cannot transform zero titles
+    if df.empty:
+        return df.reset_index(drop=True)
+
+    if method == 'minhash':
+        duplicates = _minhash_duplicates(df['title'].fillna(''))
+        return df.drop(df.index[duplicates]).reset_index(drop=True)
+
+    # Create TF-IDF vectors for titles, hashing the n-grams straight to
+    # columns so no vocabulary has to be built
+    vectorizer = HashingVectorizer(n_features=2**20, alternate_sign=False, norm=None,
+                                   stop_words='english', ngram_range=(1, 2), dtype=np.float32)
+    tfidf_matrix = TfidfTransformer().fit_transform(vectorizer.transform(df['title'].fillna('')))
     
-    # Calculate similarity matrix
-    similarity_matrix = cosine_similarity(tfidf_matrix)
+    # TF-IDF rows are L2-normalised, so their dot products are the cosine
+    # similarities. Multiply a block of rows at a time by the sparse float32
+    # matrix; the product stays sparse and no n x n matrix is built
+    tfidf_matrix = tfidf_matrix.astype(np.float32, copy=False).tocsr()
+    tfidf_columns = tfidf_matrix.T.tocsc()
     
-    # Find duplicates (similarity > 0.8)
-    duplicates = []
-    for i in range(len(similarity_matrix)):
-        for j in range(i+1, len(similarity_matrix)):
-            if similarity_matrix[i][j] > 0.8:
-                duplicates.append(j)
+    # A title is a duplicate if it is similar (> 0.8) to any earlier title
+    duplicates = set()
+    for start in range(0, tfidf_matrix.shape[0], SIMILARITY_BLOCK_ROWS):
+        similarity = (tfidf_matrix[start:start + SIMILARITY_BLOCK_ROWS] @ tfidf_columns).tocoo()
+        rows = similarity.row + start
+        duplicates.update(rows[(similarity.data > 0.8) & (similarity.col < rows)].tolist())
+    duplicates = sorted(duplicates)
     
     # Remove duplicates
     return df.drop(df.index[duplicates]).reset_index(drop=True)
 
 
+def _minhash_duplicates(titles, threshold=0.8, num_perm=128):
+    """Positions of titles that are near-duplicates of an earlier title"""
+    try:
+        from datasketch import MinHash, MinHashLSH  # type: ignore
+    except ImportError:
+        raise ImportError("method='minhash' requires the optional datasketch package "
+                          "(pip install datasketch)") from None
+
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    duplicates = []
+    for i, title in enumerate(titles):
+        title = title.lower()
+        shingles = {title[k:k + 3] for k in range(len(title) - 2)}
+        if not shingles:
+            continue
+        m = MinHash(num_perm=num_perm)
+        for shingle in shingles:
+            m.update(shingle.encode('utf8'))
+        # Single pass: keep the first title of each cluster, drop the rest
+        if lsh.query(m):
+            duplicates.append(i)
+        else:
+            lsh.insert(str(i), m)
+    return duplicates
+
+
+@lru_cache(maxsize=32)
+def _compile_criteria(criteria_key):
+    """Combined pattern of the single terms and the lowercased AND groups
+
+    criteria_key is a tuple of criteria, each a ('or', term) or
+    ('and', terms) pair, so repeated screenings reuse the same result.
+    """
+    or_terms = [terms.lower() for kind, terms in criteria_key if kind == 'or']
+    and_groups = tuple(tuple(t.lower() for t in terms) for kind, terms in criteria_key if kind == 'and')
+    pattern = '|'.join(re.escape(term) for term in or_terms) if or_terms else None
+    return pattern, and_groups
+
+
+def _match_criteria(text_lower, criteria):
+    """Boolean mask of the lowercased texts matching any of the criteria
+
+    Each criterion is a term (str) or a list of terms that must all appear
+    (AND). The single terms are searched together as one combined pattern,
+    and each AND term once, all with vectorised string operations.
+    """
+    criteria_key = tuple(
+        ('or', c) if isinstance(c, str) else ('and', tuple(c))
+        for c in criteria if isinstance(c, (str, list))
+    )
+    pattern, and_groups = _compile_criteria(criteria_key)
+
+    matched = np.zeros(len(text_lower), dtype=bool)
+    if pattern is not None:
+        matched |= text_lower.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+
+    # Search each distinct AND term only once
+    hits = {}
+    for group in and_groups:
+        group_matched = np.ones(len(text_lower), dtype=bool)
+        for term in group:
+            if term not in hits:
+                hits[term] = text_lower.str.contains(term, regex=False).to_numpy(dtype=bool)
+            group_matched &= hits[term]
+        matched |= group_matched
+    return matched
+
+
 def screen_titles_abstracts(df, inclusion_criteria, exclusion_criteria):
     """Screen titles and abstracts using keyword matching"""
 
-    def check_criteria(text, criteria, include=True):
-        text_lower = text.lower()
-        for criterion in criteria:
-            if isinstance(criterion, str):
-                if criterion.lower() in text_lower:
-                    return include
-            elif isinstance(criterion, list):  # AND criteria
-                if all(term.lower() in text_lower for term in criterion):
-                    return include
-        return not include
+    # Lowercase the titles once, in a single vectorised pass
+    title_lower = df['title'].fillna('').astype(str).str.lower()
 
     # Apply screening
-    df['include_title'] = df['title'].apply(
-        lambda x: check_criteria(x, inclusion_criteria, True)
-    )
-    df['exclude_title'] = df['title'].apply(
-        lambda x: check_criteria(x, exclusion_criteria, False)
-    )
+    df['include_title'] = _match_criteria(title_lower, inclusion_criteria)
+    df['exclude_title'] = ~_match_criteria(title_lower, exclusion_criteria)
 
     # Combine title and abstract screening
     df['passed_screening'] = (df['include_title'] & ~df['exclude_title'])